@@ -4,107 +4,88 @@ Script to add a test item to the Zotero library.
 
 This script adds a test article to the Zotero library to verify that
 the API key has write access and that we're connecting to the correct library.
+
+Pass --items FILE with a JSON list of add_item arguments to add several items
+through a single server process.
 """
 
 import os
 import sys
 import json
+import queue
+import argparse
+import itertools
 import subprocess
-from dotenv import load_dotenv
+import threading
+import time
+from contextlib import contextmanager
 
-# Load environment variables
-load_dotenv()
+# Item added when no --items file is given
+DEFAULT_TEST_ITEM = {
+    "item_type": "journalArticle",
+    "title": "Test Article for Zotero MCP Server",
+    "creators": [
+        {
+            "creatorType": "author",
+            "firstName": "John",
+            "lastName": "Doe"
+        },
+        {
+            "creatorType": "author",
+            "firstName": "Jane",
+            "lastName": "Smith"
+        }
+    ],
+    "additional_fields": {
+        "publicationTitle": "Journal of Testing",
+        "volume": "1",
+        "issue": "1",
+        "pages": "1-10",
+        "date": "2025",
+        "abstractNote": "This is a test article to verify that the Zotero MCP server can add items to the library."
+    }
+}
 
 def main():
-    """Add a test item to the Zotero library."""
+    """Add test items to the Zotero library."""
+    parser = argparse.ArgumentParser(description="Add test items to the Zotero library.")
+    parser.add_argument(
+        "--items",
+        metavar="FILE",
+        help="JSON file with a list of add_item arguments; all items share one server process"
+    )
+    args = parser.parse_args()
+    
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
+    
     print("Add Test Item to Zotero Library")
     print("===============================")
     
+    if args.items:
+        with open(args.items, "r", encoding="utf-8") as fh:
+            items = json.load(fh)
+    else:
+        items = [DEFAULT_TEST_ITEM]
+    
     # Start a new server process
     print("\nStarting Zotero MCP server...")
-    server_process = start_server()
-    
-    if not server_process:
-        print("Failed to start server. Exiting.")
-        return
-    
-    try:
-        # Add a test item
-        print("\nAdding test item...")
-        response = send_request(server_process, {
-            "jsonrpc": "2.0",
-            "method": "call_tool",
-            "params": {
-                "name": "add_item",
-                "arguments": {
-                    "item_type": "journalArticle",
-                    "title": "Test Article for Zotero MCP Server",
-                    "creators": [
-                        {
-                            "creatorType": "author",
-                            "firstName": "John",
-                            "lastName": "Doe"
-                        },
-                        {
-                            "creatorType": "author",
-                            "firstName": "Jane",
-                            "lastName": "Smith"
-                        }
-                    ],
-                    "additional_fields": {
-                        "publicationTitle": "Journal of Testing",
-                        "volume": "1",
-                        "issue": "1",
-                        "pages": "1-10",
-                        "date": "2025",
-                        "abstractNote": "This is a test article to verify that the Zotero MCP server can add items to the library."
-                    }
-                }
-            },
-            "id": 1
-        })
+    with zotero_server() as (server_process, stderr_log):
+        if not server_process:
+            print("Failed to start server. Exiting.")
+            return
         
-        if response and "result" in response and "content" in response["result"]:
-            print("Success!")
-            content = response["result"]["content"][0]["text"]
-            result = json.loads(content)
-            
-            if result.get("success"):
-                item_key = result["successful"]["0"]["key"]
-                print(f"Test item added successfully with key: {item_key}")
-                
-                # Get the item details
-                print("\nRetrieving the added item...")
-                response = send_request(server_process, {
-                    "jsonrpc": "2.0",
-                    "method": "read_resource",
-                    "params": {
-                        "uri": f"zotero://items/{item_key}"
-                    },
-                    "id": 2
-                })
-                
-                if response and "result" in response and "contents" in response["result"]:
-                    print("Success!")
-                    content = response["result"]["contents"][0]["text"]
-                    item = json.loads(content)
-                    print(f"Item details: {json.dumps(item, indent=2)}")
-                else:
-                    print("Failed to retrieve the added item.")
-            else:
-                print("Failed to add test item:")
-                print(json.dumps(result, indent=2))
-        else:
-            print("Failed to add test item.")
-            if response:
-                print(f"Response: {json.dumps(response, indent=2)}")
+        request_ids = itertools.count(1)
+        for item in items:
+            add_test_item(server_process, item, request_ids)
         
         # Check if we're using a personal or group library
         print("\nChecking library type...")
         
-        # Get the server's stderr output to see which library it's using
-        server_output = server_process.stderr.readline()
-        while server_output:
+        # Look through the server's stderr output to see which library it's using
+        for server_output in stderr_log:
             if "Initialized Zotero client for user" in server_output:
                 user_id = server_output.split("user ")[-1].strip()
                 print(f"Using personal library with user ID: {user_id}")
@@ -115,25 +96,110 @@ def main():
                 print("To use your personal library, make sure ZOTERO_GROUP_ID is not set in the .env file")
                 print("We've updated the server to prioritize the personal library, so please try again.")
                 break
-            server_output = server_process.stderr.readline()
-        
-        if not server_output:
+        else:
             print("Could not determine which library is being used.")
             print("Please check the server logs for more information.")
+
+def add_test_item(server_process, item, request_ids):
+    """
+    Add one item through the server and read it back.
+    
+    Args:
+        server_process: The running server process
+        item: add_item tool arguments
+        request_ids: Iterator supplying unique JSON-RPC request ids
+    """
+    print(f"\nAdding test item '{item.get('title', '')}'...")
+    response = send_request(server_process, {
+        "jsonrpc": "2.0",
+        "method": "call_tool",
+        "params": {
+            "name": "add_item",
+            "arguments": item
+        },
+        "id": next(request_ids)
+    })
     
+    if response and "result" in response and "content" in response["result"]:
+        print("Success!")
+        content = response["result"]["content"][0]["text"]
+        result = json.loads(content)
+        
+        if result.get("success"):
+            item_key = result["successful"]["0"]["key"]
+            print(f"Test item added successfully with key: {item_key}")
+            
+            # Get the item details
+            print("\nRetrieving the added item...")
+            response = send_request(server_process, {
+                "jsonrpc": "2.0",
+                "method": "read_resource",
+                "params": {
+                    "uri": f"zotero://items/{item_key}"
+                },
+                "id": next(request_ids)
+            })
+            
+            if response and "result" in response and "contents" in response["result"]:
+                print("Success!")
+                content = response["result"]["contents"][0]["text"]
+                item = json.loads(content)
+                print(f"Item details: {json.dumps(item, indent=2)}")
+            else:
+                print("Failed to retrieve the added item.")
+        else:
+            print("Failed to add test item:")
+            print(json.dumps(result, indent=2))
+    else:
+        print("Failed to add test item.")
+        if response:
+            print(f"Response: {json.dumps(response, indent=2)}")
+
+@contextmanager
+def zotero_server():
+    """
+    Run a Zotero MCP server process for the duration of a with block.
+    
+    Yields:
+        A (process, stderr_log) tuple from start_server, or (None, None)
+        if the server failed to start
+    """
+    server_process, stderr_log = start_server()
+    try:
+        yield server_process, stderr_log
     finally:
-        # Stop the server
-        print("\nStopping server...")
-        server_process.terminate()
-        server_process.wait(timeout=5)
-        print("Server stopped.")
+        if server_process:
+            # Stop the server
+            print("\nStopping server...")
+            server_process.terminate()
+            server_process.wait(timeout=5)
+            print("Server stopped.")
+
+def _drain(stream, lines, log):
+    """
+    Copy lines from a server output stream until it closes.
+    
+    Args:
+        stream: The stream to read from
+        lines: Queue that receives each line as it arrives
+        log: List that keeps every line for later inspection
+    """
+    for line in iter(stream.readline, ''):
+        log.append(line)
+        lines.put(line)
 
-def start_server():
+def start_server(timeout=5.0):
     """
     Start a new Zotero MCP server process.
     
+    A background thread drains the server's stderr so it can never fill up
+    and block the server.
+    
+    Args:
+        timeout: Seconds to wait for the server to report that it is running
+    
     Returns:
-        The server process, or None if the server failed to start
+        A (process, stderr_log) tuple, or (None, None) if the server failed to start
     """
     try:
         # Get the path to the server script
@@ -141,7 +207,7 @@ def start_server():
         
         # Start the server process
         process = subprocess.Popen(
-            [sys.executable, server_path],
+            [sys.executable, server_path, '--legacy'],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -149,21 +215,40 @@ def start_server():
             bufsize=1  # Line buffered
         )
         
+        stderr_lines = queue.Queue()
+        stderr_log = []
+        threading.Thread(
+            target=_drain,
+            args=(process.stderr, stderr_lines, stderr_log),
+            daemon=True
+        ).start()
+        
         # Wait for the server to start
-        for _ in range(10):
-            line = process.stderr.readline()
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                line = stderr_lines.get(timeout=remaining)
+            except queue.Empty:
+                break
             if "running on stdio" in line:
+                # The server announced its transport on stdout before logging
+                handshake = json.loads(process.stdout.readline() or '{}')
+                if handshake.get("transport") != "json":
+                    break
                 print("Server started successfully.")
-                return process
+                return process, stderr_log
         
         # Server didn't start
         print("Server didn't start properly.")
         process.terminate()
-        return None
+        return None, None
     
     except Exception as e:
         print(f"Error starting server: {str(e)}")
-        return None
+        return None, None
 
 def send_request(process, request):
     """
@@ -6,9 +6,7 @@ This script provides instructions on how to find your Zotero user ID or group ID
 which are required for the Zotero MCP server.
 """
 
-import requests
 import webbrowser
-import sys
 
 def main():
     """Provide instructions on how to find Zotero IDs."""
@@ -45,25 +43,31 @@ def main():
         api_key = input("Enter your Zotero API key: ")
         user_id = input("Enter your Zotero user ID (numeric): ")
         
+        import json
+        from urllib.error import HTTPError
+        from urllib.request import Request, urlopen
+        
         # Check if the API key is valid
         try:
-            response = requests.get(
-                f"https://api.zotero.org/users/{user_id}/items",
-                headers={"Zotero-API-Key": api_key},
-                params={"limit": 1}
+            request = Request(
+                f"https://api.zotero.org/users/{user_id}/items?limit=1",
+                headers={"Zotero-API-Key": api_key}
             )
+            with urlopen(request) as response:
+                items = json.loads(response.read())
             
-            if response.status_code == 200:
-                print("\nSuccess! Your API key and user ID are valid.")
-                print(f"Found {len(response.json())} items in your library.")
-            elif response.status_code == 403:
+            print("\nSuccess! Your API key and user ID are valid.")
+            print(f"Found {len(items)} items in your library.")
+        except HTTPError as e:
+            body = e.read().decode("utf-8", errors="replace")
+            if e.code == 403:
                 print("\nError: Invalid API key or insufficient permissions.")
                 print("Make sure your API key has read access to your library.")
-            elif response.status_code == 400 and "Invalid user ID" in response.text:
+            elif e.code == 400 and "Invalid user ID" in body:
                 print("\nError: Invalid user ID.")
                 print("Make sure you're using your numeric user ID, not your username.")
             else:
-                print(f"\nError: {response.status_code} - {response.text}")
+                print(f"\nError: {e.code} - {body}")
         except Exception as e:
             print(f"\nError checking API key: {str(e)}")
     
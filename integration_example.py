@@ -10,16 +10,299 @@ This script demonstrates how to:
 """
 
 import os
+import re
+import sys
 import json
-import subprocess
-from dotenv import load_dotenv
+import time
+import struct
+import atexit
+import asyncio
+import itertools
+import weakref
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON encoding for the RPC path: orjson when available, stdlib json otherwise.
+# _dumps always returns bytes; _loads accepts bytes or str.
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+
+def _parse_content(block):
+    """
+    Return the JSON payload of a response content block.
+    
+    Servers that attach the payload as a structured "data" value save a
+    second parse; otherwise the JSON document in "text" is decoded.
+    
+    Args:
+        block: A content block from a resource or tool response
+        
+    Returns:
+        The decoded payload
+    """
+    data = block.get("data")
+    if data is not None:
+        return data
+    return _loads(block["text"])
+
+
+# Server script used when a client is not given an explicit path
+_DEFAULT_SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'server.py')
+
+# Runs of whitespace, collapsed when normalising search queries for caching
+_WS_RE = re.compile(r"\s+")
+
+# Tools that change the library. Identical concurrent calls to these are real
+# separate writes, so they are never coalesced.
+_MUTATING_TOOLS = frozenset({"add_item", "add_items", "update_item", "delete_item", "create_collection"})
+
+# Maximum number of items the Zotero API accepts in one write request
+_BULK_ADD_CHUNK_SIZE = 50
+
+# Running server connections, keyed by (server_path, event loop). Clients on the
+# same loop share one warm subprocess instead of spawning their own.
+_connections = weakref.WeakValueDictionary()
+
+
+class _ServerConnection:
+    """A Zotero MCP server subprocess shared by every client on one event loop."""
+    
+    def __init__(self, process, framed=False):
+        """
+        Wrap a running server process and start dispatching its responses.
+        
+        Args:
+            process: The asyncio subprocess running the server
+            framed: Exchange length-prefixed messages instead of JSON lines
+        """
+        self.process = process
+        self.framed = framed
+        self.clients = 0
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._batch_waiters = []
+        self.supports_batch = True
+        self._write_lock = asyncio.Lock()
+        self._writebuf = bytearray()
+        self._reader_task = asyncio.create_task(self._read_responses())
+    
+    def is_alive(self):
+        """Return True while the server process is running."""
+        return self.process.returncode is None and not self._reader_task.done()
+    
+    async def _read_responses(self):
+        """Resolve the pending future matching the id of each response."""
+        try:
+            while True:
+                body = await self._read_message()
+                if not body:
+                    break
+                response = _loads(body)
+                if isinstance(response, list):
+                    for item in response:
+                        self._dispatch(item)
+                else:
+                    self._dispatch(response)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Zotero MCP server closed the connection"))
+            self._pending.clear()
+    
+    async def _read_message(self):
+        """Read the next message body from the server, or b'' at end of stream."""
+        stdout = self.process.stdout
+        if not self.framed:
+            return await stdout.readline()
+        try:
+            header = await stdout.readexactly(4)
+        except asyncio.IncompleteReadError:
+            return b''
+        (length,) = struct.unpack(">I", header)
+        return await stdout.readexactly(length)
+    
+    def _dispatch(self, response):
+        """Hand a single response object to whoever is waiting for it."""
+        request_id = response.get("id")
+        if request_id is None and "error" in response and self._batch_waiters:
+            # A batch the server could not process as a whole
+            future = self._batch_waiters.pop(0)
+        else:
+            future = self._pending.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_result(response)
+    
+    def _new_request(self, method, params):
+        """Build a request with a fresh id and register a future for its response."""
+        request_id = next(self._ids)
+        self._pending[request_id] = asyncio.get_running_loop().create_future()
+        return {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": request_id
+        }
+    
+    async def _write(self, message):
+        """Write one JSON message to the server."""
+        body = _dumps(message)
+        async with self._write_lock:
+            # Assemble the frame in one reused buffer rather than concatenating
+            # new bytes objects; the pipe transport copies what it keeps.
+            buffer = self._writebuf
+            buffer.clear()
+            if self.framed:
+                buffer += struct.pack(">I", len(body))
+            buffer += body
+            if not self.framed:
+                buffer += b'\n'
+            self.process.stdin.write(buffer)
+            await self.process.stdin.drain()
+    
+    async def request(self, method, params):
+        """
+        Send one JSON-RPC request and wait for its response.
+        
+        Args:
+            method: JSON-RPC method name
+            params: Request parameters
+            
+        Returns:
+            The full JSON-RPC response object
+        """
+        request = self._new_request(method, params)
+        future = self._pending[request["id"]]
+        try:
+            await self._write(request)
+            return await future
+        finally:
+            self._pending.pop(request["id"], None)
+    
+    async def request_batch(self, calls):
+        """
+        Send several JSON-RPC requests as one batch message.
+        
+        Args:
+            calls: List of (method, params) pairs
+            
+        Returns:
+            The response objects in call order, or None if the server
+            rejected the batch as a whole
+        """
+        requests = [self._new_request(method, params) for method, params in calls]
+        futures = [self._pending[request["id"]] for request in requests]
+        rejected = asyncio.get_running_loop().create_future()
+        self._batch_waiters.append(rejected)
+        try:
+            await self._write(requests)
+            remaining = set(futures)
+            while remaining and not rejected.done():
+                await asyncio.wait({rejected, *remaining}, return_when=asyncio.FIRST_COMPLETED)
+                remaining = {future for future in remaining if not future.done()}
+            if remaining:
+                return None
+            return [future.result() for future in futures]
+        finally:
+            if rejected in self._batch_waiters:
+                self._batch_waiters.remove(rejected)
+            for request, future in zip(requests, futures):
+                future.cancel()
+                self._pending.pop(request["id"], None)
+    
+    def close(self):
+        """Stop reading responses and terminate the server process."""
+        try:
+            if not self._reader_task.done():
+                self._reader_task.cancel()
+            if self.process.returncode is None:
+                self.process.terminate()
+        except (ProcessLookupError, RuntimeError):
+            # Process already gone or its event loop already closed
+            pass
+    
+    async def wait_closed(self, timeout=5):
+        """
+        Wait for the server process to exit after close().
+        
+        Args:
+            timeout: Seconds to wait before killing the process
+        """
+        if not self.process.stdin.is_closing():
+            self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+        await asyncio.gather(self._reader_task, return_exceptions=True)
+
+
+class _LRUCache:
+    """A bounded mapping that evicts the least recently used entry first."""
+    
+    def __init__(self, maxsize, ttl=None):
+        """
+        Create an empty cache.
+        
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Seconds an entry stays valid (optional, default: forever)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+    
+    def get(self, key):
+        """Return the cached value for key, or None if it is not cached."""
+        if key not in self._data:
+            return None
+        stored_at, value = self._data[key]
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def put(self, key, value):
+        """Cache value under key, evicting the oldest entry if full."""
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        """Remove every entry."""
+        self._data.clear()
+
+
+@atexit.register
+def _close_connections():
+    """Terminate any server processes still running at interpreter exit."""
+    for connection in list(_connections.values()):
+        connection.close()
 
-# Load environment variables
-load_dotenv()
 
 class ZoteroMCPClient:
     """Client for interacting with the Zotero MCP server."""
     
+    # Frame messages with a 4-byte big-endian length prefix instead of
+    # newline-delimited JSON; the server is then started with --framed
+    FRAMED = False
+    
+    # Fetch collections and recent items in the background as soon as the
+    # server is up, since nearly every session starts by reading them.
+    PREFETCH = True
+    
     def __init__(self, server_path=None):
         """
         Initialize the Zotero MCP client.
@@ -27,31 +310,112 @@ class ZoteroMCPClient:
         Args:
             server_path: Path to the Zotero MCP server script (optional)
         """
-        self.server_path = server_path or os.path.join(os.path.dirname(__file__), 'src', 'server.py')
-        self.server_process = None
+        self.server_path = server_path or _DEFAULT_SERVER_PATH
+        self._connection = None
+        
+        # Caches of parsed responses for read-only requests
+        self._citation_cache = _LRUCache(maxsize=1024)
+        self._collections_cache = _LRUCache(maxsize=1)
+        self._bibliography_cache = _LRUCache(maxsize=1024)
+        self._search_cache = _LRUCache(maxsize=256, ttl=300)
+        
+        # In-flight prefetch tasks, consumed by the first matching read
+        self._prefetch_cache = {}
+        
+        # In-flight read requests keyed by (method, canonical params), so
+        # concurrent identical reads share one round trip
+        self._inflight = {}
+    
+    def __del__(self):
+        self._release()
+    
+    @property
+    def server_process(self):
+        """The running server process, or None if the client is not started."""
+        return self._connection.process if self._connection is not None else None
     
-    def start_server(self):
-        """Start the Zotero MCP server process."""
-        if self.server_process is None or self.server_process.poll() is not None:
+    async def start_server(self):
+        """
+        Start the Zotero MCP server process.
+        
+        Safe to call repeatedly: a running server for the same path on the
+        current event loop is reused rather than spawned again.
+        """
+        if self._connection is not None and self._connection.is_alive():
+            return
+        self._release()
+        
+        key = (self.server_path, asyncio.get_running_loop())
+        connection = _connections.get(key)
+        if connection is None or not connection.is_alive():
             # Server not running, start it
-            self.server_process = subprocess.Popen(
-                ['python', self.server_path],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1  # Line buffered
+            transport = "framed" if self.FRAMED else "json"
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, '-u', self.server_path,
+                '--framed' if self.FRAMED else '--legacy',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                # Nothing reads the server's log output; a pipe left unread
+                # would eventually fill and block the server mid-request
+                stderr=asyncio.subprocess.DEVNULL
             )
+            
+            # The server names its wire format in one JSON line before any
+            # response, framed or not
+            handshake = _loads(await process.stdout.readline() or b'{}')
+            if handshake.get("transport") != transport:
+                process.terminate()
+                raise Exception(f"Zotero MCP server did not start with the {transport} transport")
+            connection = _ServerConnection(process, framed=self.FRAMED)
+            _connections[key] = connection
+        
+        connection.clients += 1
+        self._connection = connection
+        
+        if self.PREFETCH:
+            self._prefetch()
+    
+    async def stop_server(self):
+        """
+        Release this client's server process.
+        
+        The process is terminated once no other client is using it.
+        """
+        connection = self._release()
+        if connection is not None:
+            await connection.wait_closed()
+    
+    def _release(self):
+        """
+        Drop this client's hold on its connection without waiting.
+        
+        Returns:
+            The connection if this call closed it, otherwise None
+        """
+        self._cancel_prefetch()
+        connection, self._connection = getattr(self, '_connection', None), None
+        if connection is None:
+            return None
+        connection.clients -= 1
+        if connection.clients > 0:
+            return None
+        connection.close()
+        return connection
+    
+    def _prefetch(self):
+        """Start reading the resources most sessions ask for first."""
+        for key, uri in (("collections", "zotero://collections"),
+                         ("recent_items", "zotero://items/recent")):
+            if key not in self._prefetch_cache:
+                self._prefetch_cache[key] = asyncio.create_task(self._read_json_resource(uri))
     
-    def stop_server(self):
-        """Stop the Zotero MCP server process."""
-        if self.server_process is not None and self.server_process.poll() is None:
-            # Server running, stop it
-            self.server_process.terminate()
-            self.server_process.wait(timeout=5)
-            self.server_process = None
+    def _cancel_prefetch(self):
+        """Cancel and forget any prefetch that has not been consumed."""
+        for task in getattr(self, '_prefetch_cache', {}).values():
+            task.cancel()
+        self._prefetch_cache = {}
     
-    def _send_request(self, request_type, params):
+    async def _send_request(self, request_type, params):
         """
         Send a request to the Zotero MCP server.
         
@@ -62,24 +426,34 @@ class ZoteroMCPClient:
         Returns:
             Response from the server
         """
-        # Ensure server is running
-        self.start_server()
+        if request_type == "call_tool" and params.get("name") in _MUTATING_TOOLS:
+            return await self._request(request_type, params)
         
-        # Prepare request
-        request = {
-            "jsonrpc": "2.0",
-            "method": request_type,
-            "params": params,
-            "id": 1
-        }
+        key = (request_type, json.dumps(params, sort_keys=True))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request(request_type, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight_done(key, done))
         
-        # Send request
-        self.server_process.stdin.write(json.dumps(request) + '\n')
-        self.server_process.stdin.flush()
+        # Shield the shared task so one caller being cancelled doesn't
+        # cancel it for the others
+        return await asyncio.shield(task)
+    
+    def _inflight_done(self, key, task):
+        """Forget a finished in-flight request."""
+        self._inflight.pop(key, None)
+        # Waiting callers receive any exception through the shield; mark it
+        # retrieved so a request nobody waits for anymore doesn't log a warning
+        if not task.cancelled():
+            task.exception()
+    
+    async def _request(self, request_type, params):
+        """Send a request without coalescing it with identical ones."""
+        # Ensure server is running
+        await self.start_server()
         
-        # Read response
-        response_line = self.server_process.stdout.readline()
-        response = json.loads(response_line)
+        response = await self._connection.request(request_type, params)
         
         # Check for errors
         if "error" in response:
@@ -87,39 +461,91 @@ class ZoteroMCPClient:
         
         return response["result"]
     
-    def get_collections(self):
+    async def _send_batch(self, requests):
+        """
+        Send several requests to the Zotero MCP server in one message.
+        
+        Falls back to one request at a time if the server does not support
+        JSON-RPC batches.
+        
+        Args:
+            requests: List of {"method": ..., "params": ...} dictionaries
+            
+        Returns:
+            List of results, in the same order as the requests
+        """
+        # Ensure server is running
+        await self.start_server()
+        
+        calls = [(request["method"], request["params"]) for request in requests]
+        responses = None
+        if self._connection.supports_batch:
+            responses = await self._connection.request_batch(calls)
+            if responses is None:
+                self._connection.supports_batch = False
+        
+        if responses is None:
+            # The connection multiplexes by id, so the requests can still overlap
+            return list(await asyncio.gather(
+                *[self._send_request(method, params) for method, params in calls]
+            ))
+        
+        results = []
+        for response in responses:
+            if "error" in response:
+                raise Exception(f"Zotero MCP server error: {response['error']['message']}")
+            results.append(response["result"])
+        return results
+    
+    async def get_collections(self):
         """
         Get collections from the Zotero library.
         
         Returns:
             List of collections
         """
-        response = self._send_request(
-            "read_resource",
-            {"uri": "zotero://collections"}
-        )
+        collections = self._collections_cache.get("collections")
+        if collections is not None:
+            return collections
         
-        # Parse JSON content
-        content = response["contents"][0]["text"]
-        return json.loads(content)
+        prefetched = self._prefetch_cache.pop("collections", None)
+        if prefetched is not None:
+            collections = await prefetched
+        else:
+            collections = await self._read_json_resource("zotero://collections")
+        self._collections_cache.put("collections", collections)
+        return collections
     
-    def get_recent_items(self):
+    async def get_recent_items(self):
         """
         Get recent items from the Zotero library.
         
         Returns:
             List of recent items
         """
-        response = self._send_request(
+        prefetched = self._prefetch_cache.pop("recent_items", None)
+        if prefetched is not None:
+            return await prefetched
+        return await self._read_json_resource("zotero://items/recent")
+    
+    async def _read_json_resource(self, uri):
+        """
+        Read a resource whose content is a JSON document.
+        
+        Args:
+            uri: Resource URI
+            
+        Returns:
+            The parsed JSON content
+        """
+        response = await self._send_request(
             "read_resource",
-            {"uri": "zotero://items/recent"}
+            {"uri": uri}
         )
         
-        # Parse JSON content
-        content = response["contents"][0]["text"]
-        return json.loads(content)
+        return _parse_content(response["contents"][0])
     
-    def search_items(self, query, collection_key=None, limit=20):
+    async def search_items(self, query, collection_key=None, limit=20):
         """
         Search for items in the Zotero library.
         
@@ -131,7 +557,14 @@ class ZoteroMCPClient:
         Returns:
             Search results
         """
-        response = self._send_request(
+        # Queries differing only in case or spacing share a cache entry. The
+        # TTL lets newly added items show up within a few minutes.
+        cache_key = (_WS_RE.sub(" ", query.strip().lower()), collection_key, limit)
+        results = self._search_cache.get(cache_key)
+        if results is not None:
+            return results
+        
+        response = await self._send_request(
             "call_tool",
             {
                 "name": "search_items",
@@ -143,14 +576,17 @@ class ZoteroMCPClient:
             }
         )
         
-        # Parse JSON content
-        content = response["content"][0]["text"]
-        return json.loads(content)
+        results = _parse_content(response["content"][0])
+        self._search_cache.put(cache_key, results)
+        return results
     
-    def get_citation(self, item_key, style="apa"):
+    async def get_citation(self, item_key, style="apa"):
         """
         Get citation for a specific item.
         
+        To cite more than one item, prefer get_bibliography, which formats
+        all of them in a single tool call.
+        
         Args:
             item_key: Item key
             style: Citation style (e.g., apa, mla, chicago)
@@ -158,7 +594,11 @@ class ZoteroMCPClient:
         Returns:
             Citation text
         """
-        response = self._send_request(
+        citation = self._citation_cache.get((item_key, style))
+        if citation is not None:
+            return citation
+        
+        response = await self._send_request(
             "call_tool",
             {
                 "name": "get_citation",
@@ -170,9 +610,46 @@ class ZoteroMCPClient:
         )
         
         # Return citation text
-        return response["content"][0]["text"]
+        citation = response["content"][0]["text"]
+        self._citation_cache.put((item_key, style), citation)
+        return citation
+    
+    async def get_citations(self, item_keys, style="apa"):
+        """
+        Get citations for several items in a single round trip.
+        
+        Args:
+            item_keys: List of item keys
+            style: Citation style (e.g., apa, mla, chicago)
+            
+        Returns:
+            List of citation texts, in the same order as item_keys
+        """
+        citations = {item_key: self._citation_cache.get((item_key, style)) for item_key in item_keys}
+        missing = [item_key for item_key, citation in citations.items() if citation is None]
+        if not missing:
+            return [citations[item_key] for item_key in item_keys]
+        
+        results = await self._send_batch([
+            {
+                "method": "call_tool",
+                "params": {
+                    "name": "get_citation",
+                    "arguments": {
+                        "item_key": item_key,
+                        "style": style
+                    }
+                }
+            }
+            for item_key in missing
+        ])
+        
+        for item_key, result in zip(missing, results):
+            citations[item_key] = result["content"][0]["text"]
+            self._citation_cache.put((item_key, style), citations[item_key])
+        return [citations[item_key] for item_key in item_keys]
     
-    def add_item(self, item_type, title, creators=None, collection_key=None, additional_fields=None):
+    async def add_item(self, item_type, title, creators=None, collection_key=None, additional_fields=None):
         """
         Add a new item to the Zotero library.
         
@@ -186,7 +663,7 @@ class ZoteroMCPClient:
         Returns:
             Response from the server
         """
-        response = self._send_request(
+        response = await self._send_request(
             "call_tool",
             {
                 "name": "add_item",
@@ -200,11 +677,44 @@ class ZoteroMCPClient:
             }
         )
         
-        # Parse JSON content
-        content = response["content"][0]["text"]
-        return json.loads(content)
+        # New items can change collections and formatted output
+        self.invalidate_cache()
+        
+        return _parse_content(response["content"][0])
     
-    def get_bibliography(self, item_keys, style="apa"):
+    async def bulk_add_items(self, items):
+        """
+        Add many items to the Zotero library with as few requests as possible.
+        
+        Items are sent in chunks of 50, the most Zotero accepts per write.
+        
+        Args:
+            items: List of items, each a dictionary with the add_item
+                arguments (item_type, title, creators, collection_key,
+                additional_fields)
+            
+        Returns:
+            List of server responses, one per chunk
+        """
+        responses = []
+        for start in range(0, len(items), _BULK_ADD_CHUNK_SIZE):
+            response = await self._send_request(
+                "call_tool",
+                {
+                    "name": "add_items",
+                    "arguments": {
+                        "items": items[start:start + _BULK_ADD_CHUNK_SIZE]
+                    }
+                }
+            )
+            responses.append(_parse_content(response["content"][0]))
+        
+        # New items can change collections and formatted output
+        self.invalidate_cache()
+        
+        return responses
+    
+    async def get_bibliography(self, item_keys, style="apa"):
         """
         Get bibliography for multiple items.
         
@@ -215,7 +725,12 @@ class ZoteroMCPClient:
         Returns:
             Bibliography text
         """
-        response = self._send_request(
+        cache_key = (tuple(sorted(item_keys)), style)
+        bibliography = self._bibliography_cache.get(cache_key)
+        if bibliography is not None:
+            return bibliography
+        
+        response = await self._send_request(
             "call_tool",
             {
                 "name": "get_bibliography",
@@ -227,44 +742,59 @@ class ZoteroMCPClient:
         )
         
         # Return bibliography text
-        return response["content"][0]["text"]
+        bibliography = response["content"][0]["text"]
+        self._bibliography_cache.put(cache_key, bibliography)
+        return bibliography
+    
+    def invalidate_cache(self):
+        """Drop all cached responses so the next reads go to the server."""
+        self._cancel_prefetch()
+        self._citation_cache.clear()
+        self._collections_cache.clear()
+        self._bibliography_cache.clear()
+        self._search_cache.clear()
 
 
-def integrate_with_ethical_dm():
+async def integrate_with_ethical_dm():
     """
     Example of integrating the Zotero MCP server with the AI Ethical Decision-Making application.
     
     This function demonstrates how to:
     1. Configure the MCP client to use the Zotero MCP server
     2. Use the Zotero MCP server to search for references
-    3. Get citations for references
+    3. Get a bibliography for references
     4. Add references to a Zotero library
     """
+    from dotenv import load_dotenv
+    
+    # Load environment variables for the server process
+    load_dotenv()
+    
     # Initialize the Zotero MCP client
     zotero_client = ZoteroMCPClient()
     
     # Start the server
-    zotero_client.start_server()
+    await zotero_client.start_server()
     
     try:
         # Search for references related to medical ethics
         print("Searching for references related to medical ethics...")
-        search_results = zotero_client.search_items("medical ethics")
+        search_results = await zotero_client.search_items("medical ethics")
         
         # Print search results
         print(f"Found {len(search_results['results'])} references")
         
-        # If there are search results, get citations for the first 3
+        # The bibliography and the new reference don't depend on each other,
+        # so request both at once and let the server work on them concurrently
+        bibliography_request = None
         if search_results["results"]:
-            print("\nCitations:")
-            for i, item in enumerate(search_results["results"][:3]):
-                item_key = item["key"]
-                citation = zotero_client.get_citation(item_key)
-                print(f"{i+1}. {citation}")
+            bibliography_request = zotero_client.get_bibliography(
+                [item["key"] for item in search_results["results"][:3]],
+                style="apa"
+            )
         
-        # Add a new reference
         print("\nAdding a new reference...")
-        new_item = zotero_client.add_item(
+        add_request = zotero_client.add_item(
             item_type="journalArticle",
             title="Ethical Considerations in Military Medical Triage",
             creators=[
@@ -289,17 +819,26 @@ def integrate_with_ethical_dm():
             }
         )
         
+        if bibliography_request is not None:
+            bibliography, _ = await asyncio.gather(bibliography_request, add_request)
+            
+            # Print the bibliography for the first 3 search results
+            print("\nBibliography:")
+            print(bibliography)
+        else:
+            await add_request
+        
         print("New reference added successfully")
         
         # Get recent items to verify the new reference was added
         print("\nRecent items:")
-        recent_items = zotero_client.get_recent_items()
+        recent_items = await zotero_client.get_recent_items()
         for i, item in enumerate(recent_items[:3]):
             print(f"{i+1}. {item.get('data', {}).get('title', 'No title')}")
     
     finally:
         # Stop the server
-        zotero_client.stop_server()
+        await zotero_client.stop_server()
 
 
 def modify_mcp_client_for_zotero():
@@ -374,6 +913,13 @@ def modify_mcp_client_for_zotero():
     print('''
     # In app/routes/scenarios.py
     
+    def get_mcp_client():
+        # Share one client (and its server process) across requests
+        # instead of starting a new server for every request
+        if "zotero" not in current_app.extensions:
+            current_app.extensions["zotero"] = MCPClient()
+        return current_app.extensions["zotero"]
+    
     @bp.route("/scenario/<int:id>/references")
     def scenario_references(id):
         # Get scenario
@@ -383,7 +929,7 @@ def modify_mcp_client_for_zotero():
         query = f"{scenario.name} {scenario.description}"
         
         # Get references from Zotero
-        mcp_client = MCPClient()
+        mcp_client = get_mcp_client()
         references = mcp_client.get_zotero_references(query)
         
         # Render template
@@ -393,7 +939,7 @@ def modify_mcp_client_for_zotero():
 
 if __name__ == "__main__":
     # Example usage
-    integrate_with_ethical_dm()
+    asyncio.run(integrate_with_ethical_dm())
     
     print("\n" + "-" * 80 + "\n")
     
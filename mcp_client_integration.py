@@ -6,105 +6,511 @@ This file shows how to modify the existing MCP client to support the Zotero MCP
 """
 
 import json
+import asyncio
+import itertools
+import sys
 import subprocess
 import os
-from typing import List, Dict, Any, Optional, Union
+import time
+import queue
+import socket
+import struct
+import atexit
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Any, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# JSON encoding for the RPC path: orjson when available, stdlib json otherwise.
+# _dumps always returns bytes; _loads accepts bytes or str.
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+# Typed response envelopes. With msgspec installed, single JSON responses are
+# decoded straight into these structs, skipping the intermediate dicts.
+if msgspec is not None:
+    class _Content(msgspec.Struct):
+        text: str = ""
+    
+    class _Result(msgspec.Struct):
+        content: Optional[List[_Content]] = None
+        contents: Optional[List[_Content]] = None
+    
+    class _Envelope(msgspec.Struct):
+        result: Optional[_Result] = None
+        error: Optional[Dict[str, Any]] = None
+    
+    _decode_envelope = msgspec.json.Decoder(_Envelope).decode
+else:
+    _decode_envelope = _loads
+
+
+def _result_text(response: Any, field: str) -> Optional[str]:
+    """
+    Return the text of the first block in a response's result[field], or None.
+    
+    Accepts both plain response dictionaries and decoded _Envelope structs.
+    """
+    if isinstance(response, dict):
+        blocks = response["result"].get(field) if "result" in response else None
+        return blocks[0]["text"] if blocks else None
+    
+    blocks = getattr(response.result, field) if response.result is not None else None
+    return blocks[0].text if blocks else None
+
+
+# Constant parts of a single JSON-RPC request. Only the method and params are
+# encoded per call; the envelope around them is spliced in as bytes.
+_REQUEST_PREFIX = b'{"jsonrpc":"2.0","id":1,"method":'
+_REQUEST_PARAMS = b',"params":'
+_REQUEST_SUFFIX = b'}'
+
+# Wire format requested from servers that can negotiate one: MessagePack when
+# installed, otherwise JSON behind a length prefix (never line-delimited)
+_PREFERRED_TRANSPORT = "msgpack" if msgpack is not None else "framed"
+
+# Server script used when a client is not given an explicit path
+_DEFAULT_ZOTERO_SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "server.py")
+
+# Read-only resources are cached for this many seconds
+CACHE_TTL = 1800
+
+
+class _TTLCache:
+    """A bounded LRU mapping whose entries expire after a fixed time."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """Create an empty cache holding at most maxsize entries for ttl seconds."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+    
+    def get(self, key: Any) -> Any:
+        """Return the cached value for key, or None if it is missing or expired."""
+        if key not in self._data:
+            return None
+        stored_at, value = self._data[key]
+        if time.monotonic() - stored_at > self.ttl:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def put(self, key: Any, value: Any) -> None:
+        """Cache value under key, evicting the oldest entry if full."""
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
+
+
+class MCPProtocolError(Exception):
+    """Raised when a server's response cannot be read or decoded."""
+    
+    def __init__(self, message: str, data: Optional[bytes] = None):
+        """
+        Create the error.
+        
+        Args:
+            message: Description of the failure
+            data: The raw bytes received, if any, for inspection
+        """
+        super().__init__(message)
+        self.data = data
+
+
+def _encode_request(method: str, params: Dict[str, Any], transport: str) -> bytes:
+    """Encode a single request for a framed transport, without the length prefix."""
+    if transport == "msgpack":
+        return msgpack.packb({"jsonrpc": "2.0", "method": method, "params": params, "id": 1})
+    return _REQUEST_PREFIX + _dumps(method) + _REQUEST_PARAMS + _dumps(params) + _REQUEST_SUFFIX
+
+
+def _decode_framed(body: bytes, transport: str, decode=_loads) -> Any:
+    """Decode the body of a length-prefixed response."""
+    # The length prefix guarantees body is one whole message, so a decode
+    # failure means the server sent bad data, not that more is coming
+    try:
+        if transport == "msgpack":
+            return msgpack.unpackb(body, raw=False)
+        return decode(body)
+    except ValueError as e:
+        raise MCPProtocolError(f"Invalid response from server: {e}", bytes(body)) from e
+
+
+class _Channel:
+    """A connection to an MCP server and the wire format negotiated on it."""
+    
+    def __init__(self, rfile, wfile):
+        """
+        Wrap the binary streams of a server connection.
+        
+        Args:
+            rfile: Stream the server's responses are read from
+            wfile: Stream requests are written to
+        """
+        self._rfile = rfile
+        self._wfile = wfile
+        self.transport = "json"
+        
+        # One request/response exchange at a time per connection
+        self._lock = threading.RLock()
+    
+    def _read_handshake(self) -> None:
+        """Read the server's one-line JSON announcement of its wire format."""
+        handshake = _loads(self._rfile.readline() or b"{}")
+        self.transport = handshake.get("transport", "json")
+    
+    def _read_exact(self, size: int) -> bytearray:
+        """Read exactly size bytes from the server into a single preallocated buffer."""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = self._rfile.readinto(view[received:])
+            if not count:
+                raise MCPProtocolError("Server closed the connection", bytes(buffer[:received]))
+            received += count
+        return buffer
+    
+    def exchange(self, request: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Any:
+        """Write one request (or batch) to the server and read its response."""
+        if self.transport == "msgpack":
+            return self._exchange_framed(msgpack.packb(request))
+        return self._exchange_json(_dumps(request))
+    
+    def call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single request to the server and return its response."""
+        payload = _encode_request(method, params, self.transport)
+        if self.transport == "msgpack":
+            return self._exchange_framed(payload)
+        return self._exchange_json(payload, decode=_decode_envelope)
+    
+    def _exchange_framed(self, payload: bytes, decode=_loads) -> Any:
+        """Write a length-prefixed message to the server and decode the one it answers with."""
+        with self._lock:
+            self._wfile.write(struct.pack(">I", len(payload)) + payload)
+            self._wfile.flush()
+            (length,) = struct.unpack(">I", self._read_exact(4))
+            body = self._read_exact(length)
+        
+        return _decode_framed(body, self.transport, decode)
+    
+    def _exchange_json(self, payload: bytes, decode=_loads) -> Any:
+        """Write an encoded JSON message to the server and parse the one it answers with."""
+        if self.transport == "framed":
+            return self._exchange_framed(payload, decode)
+        
+        with self._lock:
+            self._wfile.write(payload + b"\n")
+            self._wfile.flush()
+            stdout = self._rfile.readline()
+        
+        if not stdout:
+            raise MCPProtocolError("Server closed the connection")
+        
+        # Parse response
+        try:
+            response = decode(stdout)
+            return response
+        except ValueError as e:
+            raise MCPProtocolError(f"Invalid response from server: {e}", stdout) from e
+
+
+class _ServerProcess(_Channel):
+    """A long-lived MCP server process talking over its stdin and stdout."""
+    
+    def __init__(self, server_path: str, transport: Optional[str] = None):
+        """
+        Start a server process that stays up to answer later requests.
+        
+        Args:
+            server_path: Path to the server script
+            transport: Wire format to ask the server for ("framed" or
+                "msgpack"); None for a server that only speaks
+                newline-delimited JSON
+        """
+        args = [sys.executable, server_path]
+        if transport:
+            args.append(f"--{transport}")
+        
+        self.process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        super().__init__(self.process.stdout, self.process.stdin)
+        
+        # The server announces the format it chose in one JSON line, so this
+        # falls back to framed JSON when msgpack is not installed on its side
+        if transport:
+            self._read_handshake()
+    
+    def poll(self) -> Optional[int]:
+        """Return the exit code, or None while the server is running."""
+        return self.process.poll()
+    
+    def terminate(self) -> None:
+        """Stop the server process."""
+        self.process.terminate()
+
+
+class _SocketConnection(_Channel):
+    """A connection to a server started with --socket."""
+    
+    def __init__(self, path: str):
+        """Connect to the server's UNIX domain socket and agree on a wire format."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        super().__init__(self.sock.makefile("rb"), self.sock.makefile("wb"))
+        
+        self._wfile.write(_dumps({"transport": _PREFERRED_TRANSPORT}) + b"\n")
+        self._wfile.flush()
+        self._read_handshake()
+    
+    def close(self) -> None:
+        """Close the connection."""
+        self._rfile.close()
+        self._wfile.close()
+        self.sock.close()
+
+
+class SocketPool:
+    """A bounded pool of reusable connections to a server's UNIX domain socket."""
+    
+    def __init__(self, path: str, maxsize: int = 8):
+        """
+        Create an empty pool; connections are opened on demand.
+        
+        Args:
+            path: Filesystem path of the server socket
+            maxsize: Maximum number of connections open at once
+        """
+        self.path = path
+        self._idle: "queue.LifoQueue[_SocketConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(maxsize)
+    
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the calling thread, returning it to the pool afterwards."""
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = _SocketConnection(self.path)
+            
+            try:
+                yield conn
+            except BaseException:
+                # The connection may hold a half-read response; don't reuse it
+                conn.close()
+                raise
+            self._idle.put(conn)
+    
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
 
 class MCPClient:
     """Client for interacting with MCP servers."""
     
+    # Server name -> (attribute holding its script path, attribute holding the
+    # socket of an already running server, whether it can negotiate a framed
+    # wire format). Only the bundled Zotero server supports --socket and framing.
+    _SERVERS = {
+        "zotero": ("zotero_server_path", "zotero_socket_path", True),
+        "ontology": ("ontology_server_path", None, False),
+    }
+    
     def __init__(self):
         """Initialize the MCP client."""
         # Path to the Zotero MCP server
-        self.zotero_server_path = os.path.join(os.path.dirname(__file__), "src", "server.py")
+        self.zotero_server_path = _DEFAULT_ZOTERO_SERVER_PATH
+        
+        # Socket of a Zotero MCP server started with --socket; when set, requests
+        # go through a connection pool instead of a private server process
+        self.zotero_socket_path = os.getenv("ZOTERO_MCP_SOCKET")
         
         # Path to the ontology MCP server (existing server)
         self.ontology_server_path = "/path/to/ontology/server.py"
+        
+        # Long-lived server processes by server name, started on first use
+        self._procs: Dict[str, _ServerProcess] = {}
+        
+        # Socket connection pools by socket path
+        self._pools: Dict[str, SocketPool] = {}
+        
+        # Guards starting servers and creating pools, which the async methods
+        # may do from several worker threads at once
+        self._start_lock = threading.Lock()
+        
+        # Parsed read-only resources, keyed by (kind, argument)
+        self._zotero_cache = _TTLCache(maxsize=512, ttl=CACHE_TTL)
+        self._ontology_cache = _TTLCache(maxsize=512, ttl=CACHE_TTL)
+        
+        atexit.register(self._shutdown)
     
-    def _send_request_to_zotero(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Send a request to the Zotero MCP server."""
-        # Create request
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": 1
-        }
-        
-        # Convert request to JSON
-        request_json = json.dumps(request)
-        
-        # Send request to server
-        process = subprocess.Popen(
-            ["python", self.zotero_server_path],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+    def _shutdown(self) -> None:
+        """Terminate any running server processes and close pooled connections."""
+        for process in self._procs.values():
+            if process.poll() is None:
+                process.terminate()
+        self._procs.clear()
         
-        # Send request
-        stdout, stderr = process.communicate(input=request_json + "\n")
+        for pool in self._pools.values():
+            pool.close()
+        self._pools.clear()
+    
+    def _server(self, server: str) -> _ServerProcess:
+        """Return the running process for a server, starting it if needed."""
+        with self._start_lock:
+            process = self._procs.get(server)
+            
+            # Reuse the running server, restarting it if it has exited
+            if process is None or process.poll() is not None:
+                path_attribute, _, negotiates = self._SERVERS[server]
+                process = _ServerProcess(
+                    getattr(self, path_attribute),
+                    transport=_PREFERRED_TRANSPORT if negotiates else None
+                )
+                self._procs[server] = process
+            
+            return process
+    
+    @contextmanager
+    def _connection(self, server: str):
+        """Yield a channel to a server: a pooled socket connection if configured, else its process."""
+        socket_attribute = self._SERVERS[server][1]
+        socket_path = getattr(self, socket_attribute) if socket_attribute else None
         
-        # Parse response
-        try:
-            response = json.loads(stdout)
-            return response
-        except json.JSONDecodeError:
-            raise Exception(f"Invalid response from server: {stdout}")
-    
-    def _send_request_to_ontology(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Send a request to the ontology MCP server."""
-        # Create request
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": 1
-        }
-        
-        # Convert request to JSON
-        request_json = json.dumps(request)
-        
-        # Send request to server
-        process = subprocess.Popen(
-            ["python", self.ontology_server_path],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+        if not socket_path:
+            yield self._server(server)
+            return
         
-        # Send request
-        stdout, stderr = process.communicate(input=request_json + "\n")
+        with self._start_lock:
+            pool = self._pools.get(socket_path)
+            if pool is None:
+                pool = self._pools[socket_path] = SocketPool(socket_path)
+        with pool.connection() as conn:
+            yield conn
+    
+    def _send(self, server: str, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a request to one of the MCP servers.
         
-        # Parse response
-        try:
-            response = json.loads(stdout)
-            return response
-        except json.JSONDecodeError:
-            raise Exception(f"Invalid response from server: {stdout}")
+        Args:
+            server: Server name, "zotero" or "ontology"
+            method: JSON-RPC method
+            params: JSON-RPC parameters
+            
+        Returns:
+            The JSON-RPC response
+        """
+        with self._connection(server) as channel:
+            return channel.call(method, params)
+    
+    def _send_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several requests to the Zotero MCP server as one JSON-RPC batch.
+        
+        Falls back to one request per call if the server answers the batch
+        with a single object instead of an array. The array may come back in
+        any order, so responses are matched to calls by id; a call left
+        without a response (e.g. when the server answers with a null id) gets
+        an error response instead.
+        
+        Args:
+            calls: List of (method, params) pairs
+            
+        Returns:
+            List of responses in the same order as calls
+        """
+        if not calls:
+            return []
+        
+        requests = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+            for i, (method, params) in enumerate(calls)
+        ]
+        
+        with self._connection("zotero") as channel:
+            responses = channel.exchange(requests)
+        
+        if not isinstance(responses, list):
+            return [self._send("zotero", method, params) for method, params in calls]
+        
+        by_id = {response.get("id"): response for response in responses}
+        return [
+            by_id.get(request["id"]) or {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32603, "message": "No response to this request in the batch"},
+            }
+            for request in requests
+        ]
     
     # Existing methods for the ontology MCP server
     
     def get_ontology(self, domain: str) -> Dict[str, Any]:
         """Get the ontology for a domain."""
-        response = self._send_request_to_ontology(
+        cached = self._ontology_cache.get(("ontology", domain))
+        if cached is not None:
+            return cached
+        
+        response = self._send(
+            "ontology",
             method="read_resource",
             params={
                 "uri": f"ontology://{domain}"
             }
         )
         
-        if "result" in response and "contents" in response["result"]:
-            content = response["result"]["contents"][0]["text"]
-            return json.loads(content)
+        content = _result_text(response, "contents")
+        if content is not None:
+            ontology = _loads(content)
+            self._ontology_cache.put(("ontology", domain), ontology)
+            return ontology
         
         return {}
     
     def get_ethical_guidelines(self, domain: str) -> List[Dict[str, Any]]:
         """Get ethical guidelines for a domain."""
-        response = self._send_request_to_ontology(
+        cached = self._ontology_cache.get(("guidelines", domain))
+        if cached is not None:
+            return cached
+        
+        response = self._send(
+            "ontology",
             method="call_tool",
             params={
                 "name": "get_guidelines",
@@ -114,15 +520,18 @@ class MCPClient:
             }
         )
         
-        if "result" in response and "content" in response["result"]:
-            content = response["result"]["content"][0]["text"]
-            return json.loads(content)
+        content = _result_text(response, "content")
+        if content is not None:
+            guidelines = _loads(content)
+            self._ontology_cache.put(("guidelines", domain), guidelines)
+            return guidelines
         
         return []
     
     def evaluate_decision(self, domain: str, decision: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate a decision against ethical guidelines."""
-        response = self._send_request_to_ontology(
+        response = self._send(
+            "ontology",
             method="call_tool",
             params={
                 "name": "evaluate_decision",
@@ -133,61 +542,101 @@ class MCPClient:
             }
         )
         
-        if "result" in response and "content" in response["result"]:
-            content = response["result"]["content"][0]["text"]
-            return json.loads(content)
+        content = _result_text(response, "content")
+        if content is not None:
+            return _loads(content)
         
         return {}
     
     # New methods for the Zotero MCP server
     
-    def search_zotero_items(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search for items in the Zotero library."""
-        response = self._send_request_to_zotero(
+    def search_zotero_items(self, query: str, limit: int = 10, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Search for items in the Zotero library, returning only the given fields (None for all)."""
+        response = self._send(
+            "zotero",
             method="call_tool",
             params={
                 "name": "search_items",
                 "arguments": {
                     "query": query,
-                    "limit": limit
+                    "limit": limit,
+                    "fields": list(fields) if fields else None
                 }
             }
         )
         
-        if "result" in response and "content" in response["result"]:
-            content = response["result"]["content"][0]["text"]
-            results = json.loads(content)
+        content = _result_text(response, "content")
+        if content is not None:
+            results = _loads(content)
             return results["results"]
         
         return []
     
+    async def asearch_zotero_items(self, query: str, limit: int = 10, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Search for items without blocking the event loop.
+        
+        Several searches can be awaited together with asyncio.gather. They
+        overlap when the client uses a socket server (see zotero_socket_path);
+        over a private stdio process they are answered one after another.
+        """
+        return await asyncio.to_thread(self.search_zotero_items, query, limit, fields)
+    
     def add_zotero_item(self, item_type: str, title: str, creators: List[Dict[str, str]], additional_fields: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """Add an item to the Zotero library."""
-        response = self._send_request_to_zotero(
+        return self.add_zotero_items([
+            {
+                "item_type": item_type,
+                "title": title,
+                "creators": creators,
+                "additional_fields": additional_fields or {}
+            }
+        ])[0]
+    
+    def add_zotero_items(self, items: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Add several items to the Zotero library in a single request.
+        
+        Args:
+            items: Items as dictionaries of add_item arguments (item_type,
+                title, creators, additional_fields)
+            
+        Returns:
+            The new item keys in input order, with None for items that failed
+        """
+        if not items:
+            return []
+        
+        response = self._send(
+            "zotero",
             method="call_tool",
             params={
-                "name": "add_item",
+                "name": "add_items",
                 "arguments": {
-                    "item_type": item_type,
-                    "title": title,
-                    "creators": creators,
-                    "additional_fields": additional_fields or {}
+                    "items": items
                 }
             }
         )
         
-        if "result" in response and "content" in response["result"]:
-            content = response["result"]["content"][0]["text"]
-            result = json.loads(content)
+        keys: List[Optional[str]] = [None] * len(items)
+        
+        content = _result_text(response, "content")
+        if content is not None:
+            result = _loads(content)
+            
+            for index, created in result.get("successful", {}).items():
+                keys[int(index)] = created["key"]
             
             if result.get("success"):
-                return result["successful"]["0"]["key"]
+                # New items can change collections and item listings
+                self._zotero_cache.clear()
         
-        return None
+        return keys
     
     def get_zotero_citation(self, item_key: str, style: str = "apa") -> str:
         """Get a citation for an item in the Zotero library."""
-        response = self._send_request_to_zotero(
+        response = self._send(
+            "zotero",
             method="call_tool",
             params={
                 "name": "get_citation",
@@ -198,14 +647,16 @@ class MCPClient:
             }
         )
         
-        if "result" in response and "content" in response["result"]:
-            return response["result"]["content"][0]["text"]
+        content = _result_text(response, "content")
+        if content is not None:
+            return content
         
         return ""
     
     def get_zotero_bibliography(self, item_keys: List[str], style: str = "apa") -> str:
         """Get a bibliography for items in the Zotero library."""
-        response = self._send_request_to_zotero(
+        response = self._send(
+            "zotero",
             method="call_tool",
             params={
                 "name": "get_bibliography",
@@ -216,61 +667,238 @@ class MCPClient:
             }
         )
         
-        if "result" in response and "content" in response["result"]:
-            return response["result"]["content"][0]["text"]
+        content = _result_text(response, "content")
+        if content is not None:
+            return content
         
         return ""
     
     def get_zotero_collections(self) -> List[Dict[str, Any]]:
         """Get collections from the Zotero library."""
-        response = self._send_request_to_zotero(
+        cached = self._zotero_cache.get(("collections", None))
+        if cached is not None:
+            return cached
+        
+        response = self._send(
+            "zotero",
             method="read_resource",
             params={
                 "uri": "zotero://collections"
             }
         )
         
-        if "result" in response and "contents" in response["result"]:
-            content = response["result"]["contents"][0]["text"]
-            return json.loads(content)
+        content = _result_text(response, "contents")
+        if content is not None:
+            collections = _loads(content)
+            self._zotero_cache.put(("collections", None), collections)
+            return collections
         
         return []
     
-    def get_zotero_items(self, collection_key: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get items from the Zotero library."""
-        if collection_key:
-            uri = f"zotero://collections/{collection_key}/items"
-        else:
-            uri = "zotero://items/top"
-        
-        response = self._send_request_to_zotero(
-            method="read_resource",
+    def get_zotero_items(self, collection_key: Optional[str] = None, limit: int = 50, fields: Optional[List[str]] = None, start: int = 0) -> List[Dict[str, Any]]:
+        """Get items from the Zotero library, returning only the given fields (None for all)."""
+        response = self._send(
+            "zotero",
+            method="call_tool",
             params={
-                "uri": uri
+                "name": "list_items",
+                "arguments": {
+                    "collection_key": collection_key,
+                    "limit": limit,
+                    "fields": list(fields) if fields else None,
+                    "start": start
+                }
             }
         )
         
-        if "result" in response and "contents" in response["result"]:
-            content = response["result"]["contents"][0]["text"]
-            return json.loads(content)
+        content = _result_text(response, "content")
+        if content is not None:
+            return _loads(content)
         
         return []
     
+    def iter_zotero_items(self, collection_key: Optional[str] = None, fields: Optional[List[str]] = None, page_size: int = 50) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every item in the library or a collection, one page at a time.
+        
+        Only one page of items is held in memory, so callers that process
+        items as they go can walk collections of any size. Stop iterating
+        early to skip fetching the remaining pages.
+        """
+        for start in itertools.count(0, page_size):
+            page = self.get_zotero_items(collection_key, limit=page_size, fields=fields, start=start)
+            yield from page
+            if len(page) < page_size:
+                return
+    
     def get_zotero_item(self, item_key: str) -> Optional[Dict[str, Any]]:
         """Get an item from the Zotero library."""
-        response = self._send_request_to_zotero(
+        cached = self._zotero_cache.get(("item", item_key))
+        if cached is not None:
+            return cached
+        
+        response = self._send(
+            "zotero",
             method="read_resource",
             params={
                 "uri": f"zotero://items/{item_key}"
             }
         )
         
-        if "result" in response and "contents" in response["result"]:
-            content = response["result"]["contents"][0]["text"]
-            return json.loads(content)
+        content = _result_text(response, "contents")
+        if content is not None:
+            item = _loads(content)
+            self._zotero_cache.put(("item", item_key), item)
+            return item
         
         return None
 
+    def get_zotero_items_bulk(self, item_keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get several items from the Zotero library in a single round trip."""
+        responses = self._send_batch([
+            ("read_resource", {"uri": f"zotero://items/{item_key}"})
+            for item_key in item_keys
+        ])
+        
+        items = []
+        for response in responses:
+            content = _result_text(response, "contents")
+            if content is not None:
+                items.append(_loads(content))
+            else:
+                items.append(None)
+        
+        return items
+
+class AsyncMCPClient:
+    """
+    Asyncio client for the Zotero MCP server.
+    
+    Use this from async applications so a Zotero request in flight does not
+    block the event loop. Requests share one server process and are answered
+    in turn; create several clients (or use a --socket server with MCPClient)
+    for requests that should run in parallel.
+    """
+    
+    def __init__(self, server_path: Optional[str] = None):
+        """
+        Initialize the client. The server is started on first use.
+        
+        Args:
+            server_path: Path to the Zotero MCP server script (optional)
+        """
+        self.zotero_server_path = server_path or _DEFAULT_ZOTERO_SERVER_PATH
+        self.transport = None
+        self._proc = None
+        self._lock = asyncio.Lock()
+    
+    async def _ensure_server(self) -> None:
+        """Start the server if it is not running and read its transport handshake."""
+        if self._proc is not None and self._proc.returncode is None:
+            return
+        
+        self._proc = await asyncio.create_subprocess_exec(
+            sys.executable, self.zotero_server_path, f"--{_PREFERRED_TRANSPORT}",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        
+        handshake = _loads(await self._proc.stdout.readline() or b"{}")
+        self.transport = handshake.get("transport")
+        if self.transport not in ("framed", "msgpack"):
+            raise MCPProtocolError(f"Unsupported server transport: {self.transport}")
+    
+    async def _send_async(self, method: str, params: Dict[str, Any]) -> Any:
+        """Send a request to the Zotero MCP server and return its response."""
+        async with self._lock:
+            await self._ensure_server()
+            
+            payload = _encode_request(method, params, self.transport)
+            self._proc.stdin.write(struct.pack(">I", len(payload)) + payload)
+            await self._proc.stdin.drain()
+            
+            try:
+                (length,) = struct.unpack(">I", await self._proc.stdout.readexactly(4))
+                body = await self._proc.stdout.readexactly(length)
+            except asyncio.IncompleteReadError as e:
+                raise MCPProtocolError("Server closed the connection", e.partial) from e
+        
+        return _decode_framed(body, self.transport, _decode_envelope)
+    
+    async def _call_tool(self, name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        """Call a tool and return the text of its result, or None."""
+        response = await self._send_async("call_tool", {"name": name, "arguments": arguments})
+        return _result_text(response, "content")
+    
+    async def _read_resource(self, uri: str) -> Optional[str]:
+        """Read a resource and return its text, or None."""
+        response = await self._send_async("read_resource", {"uri": uri})
+        return _result_text(response, "contents")
+    
+    async def close(self) -> None:
+        """Stop the server process."""
+        if self._proc is None or self._proc.returncode is not None:
+            return
+        
+        self._proc.stdin.close()
+        try:
+            await asyncio.wait_for(self._proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            self._proc.kill()
+            await self._proc.wait()
+    
+    async def search_zotero_items(self, query: str, limit: int = 10, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Search for items in the Zotero library, returning only the given fields (None for all)."""
+        content = await self._call_tool("search_items", {
+            "query": query,
+            "limit": limit,
+            "fields": list(fields) if fields else None
+        })
+        return _loads(content)["results"] if content is not None else []
+    
+    async def get_zotero_items(self, collection_key: Optional[str] = None, limit: int = 50, fields: Optional[List[str]] = None, start: int = 0) -> List[Dict[str, Any]]:
+        """Get items from the Zotero library, returning only the given fields (None for all)."""
+        content = await self._call_tool("list_items", {
+            "collection_key": collection_key,
+            "limit": limit,
+            "fields": list(fields) if fields else None,
+            "start": start
+        })
+        return _loads(content) if content is not None else []
+    
+    async def get_zotero_item(self, item_key: str) -> Optional[Dict[str, Any]]:
+        """Get an item from the Zotero library."""
+        content = await self._read_resource(f"zotero://items/{item_key}")
+        return _loads(content) if content is not None else None
+    
+    async def get_zotero_collections(self) -> List[Dict[str, Any]]:
+        """Get collections from the Zotero library."""
+        content = await self._read_resource("zotero://collections")
+        return _loads(content) if content is not None else []
+    
+    async def get_zotero_citation(self, item_key: str, style: str = "apa") -> str:
+        """Get a citation for an item in the Zotero library."""
+        content = await self._call_tool("get_citation", {"item_key": item_key, "style": style})
+        return content or ""
+    
+    async def get_zotero_bibliography(self, item_keys: List[str], style: str = "apa") -> str:
+        """Get a bibliography for items in the Zotero library."""
+        content = await self._call_tool("get_bibliography", {"item_keys": item_keys, "style": style})
+        return content or ""
+    
+    async def add_zotero_items(self, items: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Add several items to the Zotero library; returns the new keys, None where one failed."""
+        if not items:
+            return []
+        
+        keys: List[Optional[str]] = [None] * len(items)
+        content = await self._call_tool("add_items", {"items": items})
+        if content is not None:
+            for index, created in _loads(content).get("successful", {}).items():
+                keys[int(index)] = created["key"]
+        return keys
+
 # Example usage
 if __name__ == "__main__":
     client = MCPClient()
@@ -23,6 +23,14 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "speedups": [
+            "orjson>=3.10",
+            "msgpack>=1.0",
+            "msgspec>=0.18",
+            "uvloop>=0.17; platform_system != 'Windows'",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "zotero-mcp-server=src.server:main",
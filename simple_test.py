@@ -8,34 +8,101 @@ This script creates a new instance of the Zotero MCP server and tests its functi
 import os
 import sys
 import json
+import time
+import socket
+import selectors
 import subprocess
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Messages cross the pipes as bytes: orjson encodes to and parses from bytes
+# directly, so no text layer is needed
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    def dumps(message):
+        return json.dumps(message).encode()
+    loads = json.loads
+
+# Command that starts the server under test
+SERVER_COMMAND = (sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'server.py'), '--legacy')
+
+# Seconds to wait for the server to report that it is ready
+STARTUP_TIMEOUT = 10
 
 def main():
     """Run tests for the Zotero MCP server."""
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
+    
     print("Simple Zotero MCP Server Test")
     print("=============================")
     
-    # Start a new server process
-    print("\nStarting Zotero MCP server...")
-    server_process = start_server()
+    # Reuse a running server when one is listening on a socket, otherwise
+    # start a new server process
+    socket_path = os.getenv("ZOTERO_MCP_SOCKET")
+    if socket_path:
+        print(f"\nConnecting to Zotero MCP server at {socket_path}...")
+        server_process = connect_server(socket_path)
+    else:
+        print("\nStarting Zotero MCP server...")
+        server_process = start_server()
     
     if not server_process:
         print("Failed to start server. Exiting.")
         return
     
     try:
+        # Build every probe up front so they can be pipelined to the server
+        search_queries = ["ethics", "medical", "research", ""]  # Empty string gets all items
+        search_batch = [
+            {
+                "jsonrpc": "2.0",
+                "method": "call_tool",
+                "params": {
+                    "name": "search_items",
+                    "arguments": {
+                        "query": query,
+                        "limit": 10
+                    }
+                },
+                "id": 4 + i
+            }
+            for i, query in enumerate(search_queries)
+        ]
+        responses = send_all(server_process, [
+            {
+                "jsonrpc": "2.0",
+                "method": "list_resources",
+                "params": {},
+                "id": 1
+            },
+            {
+                "jsonrpc": "2.0",
+                "method": "list_tools",
+                "params": {},
+                "id": 2
+            },
+            {
+                "jsonrpc": "2.0",
+                "method": "read_resource",
+                "params": {
+                    "uri": "zotero://items/recent"
+                },
+                "id": 3
+            },
+            search_batch
+        ])
+        
         # Test list_resources
         print("\nTesting list_resources...")
-        response = send_request(server_process, {
-            "jsonrpc": "2.0",
-            "method": "list_resources",
-            "params": {},
-            "id": 1
-        })
+        response = responses.get(1)
         
         if response and "result" in response:
             print("Success!")
@@ -48,12 +115,7 @@ def main():
         
         # Test list_tools
         print("\nTesting list_tools...")
-        response = send_request(server_process, {
-            "jsonrpc": "2.0",
-            "method": "list_tools",
-            "params": {},
-            "id": 2
-        })
+        response = responses.get(2)
         
         if response and "result" in response:
             print("Success!")
@@ -66,14 +128,7 @@ def main():
         
         # Test get_recent_items to verify library access
         print("\nTesting get_recent_items...")
-        response = send_request(server_process, {
-            "jsonrpc": "2.0",
-            "method": "read_resource",
-            "params": {
-                "uri": "zotero://items/recent"
-            },
-            "id": 3
-        })
+        response = responses.get(3)
         
         if response and "result" in response and "contents" in response["result"]:
             print("Success!")
@@ -96,24 +151,13 @@ def main():
         
         # Test search_items with different queries
         print("\nTesting search_items with multiple queries...")
-        search_queries = ["ethics", "medical", "research", ""]  # Empty string gets all items
         
-        for query in search_queries:
+        for request in search_batch:
+            query = request["params"]["arguments"]["query"]
             query_display = query if query else "ALL ITEMS"
             print(f"\nSearching for: '{query_display}'...")
             
-            response = send_request(server_process, {
-                "jsonrpc": "2.0",
-                "method": "call_tool",
-                "params": {
-                    "name": "search_items",
-                    "arguments": {
-                        "query": query,
-                        "limit": 10
-                    }
-                },
-                "id": 4
-            })
+            response = responses.get(request["id"])
             
             if response and "result" in response and "content" in response["result"]:
                 content = response["result"]["content"][0]["text"]
@@ -133,11 +177,63 @@ def main():
                     print(f"Response: {json.dumps(response, indent=2)}")
     
     finally:
-        # Stop the server
-        print("\nStopping server...")
-        server_process.terminate()
-        server_process.wait(timeout=5)
-        print("Server stopped.")
+        if isinstance(server_process, ServerConnection):
+            # Leave the shared server running for the next run
+            server_process.close()
+            print("\nDisconnected from server.")
+        else:
+            # Stop the server
+            print("\nStopping server...")
+            server_process.terminate()
+            server_process.wait(timeout=5)
+            print("Server stopped.")
+
+class ServerConnection:
+    """
+    Connection to a server already running with --socket.
+    
+    Exposes the same stdin/stdout attributes as a server process, so requests
+    are sent the same way whether the server was spawned or shared.
+    """
+    
+    def __init__(self, sock):
+        self.sock = sock
+        self.stdin = self.stdout = sock.makefile("rwb")
+    
+    def close(self):
+        self.stdin.close()
+        self.sock.close()
+
+def connect_server(socket_path):
+    """
+    Connect to a Zotero MCP server listening on a UNIX domain socket.
+    
+    Args:
+        socket_path: Path of the socket the server was started with
+        
+    Returns:
+        The server connection, or None if the server could not be reached
+    """
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+        connection = ServerConnection(sock)
+        
+        # Ask for newline-delimited JSON; the server confirms the transport
+        connection.stdin.write(dumps({"transport": "json"}) + b'\n')
+        connection.stdin.flush()
+        handshake = loads(connection.stdout.readline())
+        if handshake.get("transport") != "json":
+            print(f"Unexpected transport: {handshake.get('transport')}")
+            connection.close()
+            return None
+        
+        print("Connected to server.")
+        return connection
+    
+    except Exception as e:
+        print(f"Error connecting to server: {str(e)}")
+        return None
 
 def start_server():
     """
@@ -147,23 +243,36 @@ def start_server():
         The server process, or None if the server failed to start
     """
     try:
-        # Get the path to the server script
-        server_path = os.path.join(os.path.dirname(__file__), 'src', 'server.py')
-        
         # Start the server process
         process = subprocess.Popen(
-            [sys.executable, server_path],
+            SERVER_COMMAND,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1  # Line buffered
+            stderr=subprocess.PIPE
         )
         
-        # Wait for the server to start
-        for _ in range(10):
-            line = process.stderr.readline()
-            if "running on stdio" in line:
+        # The server announces its transport on stdout once it is ready.
+        # stderr is watched too, read in raw chunks so a partial log line
+        # never blocks, to notice a server that exits during startup.
+        selector = selectors.DefaultSelector()
+        selector.register(process.stderr, selectors.EVENT_READ)
+        selector.register(process.stdout, selectors.EVENT_READ)
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        ready = False
+        try:
+            while not ready and (remaining := deadline - time.monotonic()) > 0:
+                for key, _ in selector.select(remaining):
+                    if key.fileobj is process.stdout:
+                        ready = True
+                    elif not os.read(process.stderr.fileno(), 4096):
+                        # stderr closed: the server exited during startup
+                        deadline = 0
+        finally:
+            selector.close()
+        
+        if ready:
+            line = process.stdout.readline()
+            if line and loads(line).get("transport") == "json":
                 print("Server started successfully.")
                 return process
         
@@ -188,23 +297,54 @@ def send_request(process, request):
         The response object from the server
     """
     try:
-        # Convert request to JSON
-        request_json = json.dumps(request)
-        
         # Send request
-        process.stdin.write(request_json + '\n')
+        process.stdin.write(dumps(request) + b'\n')
         process.stdin.flush()
         
         # Read response
         response_line = process.stdout.readline()
         
         # Parse response
-        response = json.loads(response_line)
+        response = loads(response_line)
         return response
     
     except Exception as e:
         print(f"Error sending request: {str(e)}")
         return None
 
+def send_all(process, requests_list):
+    """
+    Pipeline several requests to the server and collect their responses.
+    
+    All requests are written before any response is read, so the server can
+    work through them without waiting on the client. An entry that is itself
+    a list is sent as one JSON-RPC batch.
+    
+    Args:
+        process: The server process
+        requests_list: The request objects (or batches) to send
+        
+    Returns:
+        Dictionary mapping request IDs to response objects
+    """
+    try:
+        # Send every request before reading anything back
+        for request in requests_list:
+            process.stdin.write(dumps(request) + b'\n')
+        process.stdin.flush()
+        
+        # Read one response line per request; responses carry their IDs
+        responses = {}
+        for _ in requests_list:
+            response_line = process.stdout.readline()
+            response = loads(response_line)
+            for item in response if isinstance(response, list) else [response]:
+                responses[item.get("id")] = item
+        return responses
+    
+    except Exception as e:
+        print(f"Error sending requests: {str(e)}")
+        return {}
+
 if __name__ == "__main__":
     main()
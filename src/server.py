@@ -7,20 +7,61 @@ using the latest MCP paradigms and the official Python SDK.
 """
 
 import os
+import re
 import sys
 import json
+import time
+import queue
+import atexit
+import signal
+import struct
+import asyncio
+import argparse
 import logging
+import logging.handlers
+import functools
+import importlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any, Optional
 from dotenv import load_dotenv
 from pyzotero import zotero
 from mcp.server.fastmcp import FastMCP
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stderr
-)
+from mcp.server.stdio import stdio_server
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Configure logging. Records are formatted and written to stderr by a
+# background thread, so logging never blocks the event loop on a slow pipe.
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.root.setLevel(logging.INFO)
 logger = logging.getLogger('zotero-mcp-server')
 
 # Load environment variables
@@ -32,6 +73,142 @@ mcp = FastMCP("Zotero MCP Server")
 # Global Zotero client instance
 zot: Optional[zotero.Zotero] = None
 
+# Responses are read by programs, so they are sent compact; set
+# ZOTERO_MCP_DEBUG to indent them for reading by eye
+PRETTY_JSON = bool(os.getenv("ZOTERO_MCP_DEBUG"))
+
+# Maximum number of items the Zotero API accepts in a single write request
+ZOTERO_WRITE_BATCH_SIZE = 50
+
+# Maximum number of items the Zotero API returns for a single read request;
+# longer listings are fetched as several pages in parallel
+ZOTERO_READ_PAGE_SIZE = 100
+ZOTERO_READ_WORKERS = 8
+
+# Item types and their fields are part of Zotero's global schema, which changes
+# rarely. Lookups are cached for a day, in memory and on disk across restarts.
+SCHEMA_CACHE_TTL = 24 * 60 * 60
+SCHEMA_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "zotero-mcp", "schema.json")
+
+# Schema lookup key -> [fetched at (epoch seconds), JSON response]
+_schema_cache: Optional[dict[str, list]] = None
+_schema_cache_lock = threading.Lock()
+
+# Library responses kept in memory, evicting the least recently used
+LIBRARY_CACHE_SIZE = 1024
+
+# Resource key -> (library version, JSON response)
+_library_cache: "OrderedDict[str, tuple[int, str]]" = OrderedDict()
+_library_cache_lock = threading.Lock()
+
+# Number of items in each page of the item listing resources
+RESOURCE_PAGE_SIZE = 50
+
+# Cached responses are keyed to the library version. The version is asked of
+# Zotero at most once per interval (seconds), and again after every write
+# made through this server; changes made elsewhere show up within the interval.
+LIBRARY_VERSION_TTL = 60
+
+# (library version, monotonic time it was fetched)
+_library_version: Optional[tuple[int, float]] = None
+
+# Plain-word searches are answered from a local index of every item, brought
+# up to date with the items changed since its version when the library changes.
+# {"version": library version, "entries": [(lowercase title, creators and year, item), ...]}
+_search_index: Optional[dict[str, Any]] = None
+_search_index_lock = threading.Lock()
+
+# Formatted citations kept in memory, evicting the least recently used
+CITATION_CACHE_SIZE = 2048
+
+# (item keys, style) -> (library version, formatted citation)
+_citation_cache: "OrderedDict[tuple[tuple[str, ...], str], tuple[int, str]]" = OrderedDict()
+_citation_lock = threading.Lock()
+
+# Wire formats for the legacy JSON-RPC dialect: newline-delimited JSON, and
+# JSON or MessagePack documents behind a 4-byte big-endian length prefix
+LEGACY_TRANSPORTS = ("json", "framed", "msgpack")
+
+# Legacy resource texts at least this long keep their JSON string encoding
+# for reuse, so rereading a large cached listing does not re-escape it
+LEGACY_ENCODED_TEXT_MIN = 64 * 1024
+LEGACY_ENCODED_TEXT_CACHE = 8
+
+# Where --socket listens when no path is given
+DEFAULT_SOCKET_PATH = os.getenv("ZOTERO_MCP_SOCKET", "/tmp/zotero-mcp.sock")
+
+# Worker threads for the blocking pyzotero calls behind resources and tools.
+# The calls wait on the network, so far more threads than cores pay off.
+ZOTERO_MCP_THREADS = int(os.getenv("ZOTERO_MCP_THREADS", "32"))
+_zotero_executor = ThreadPoolExecutor(max_workers=ZOTERO_MCP_THREADS, thread_name_prefix="zotero")
+
+
+def _size_connection_pool(client: zotero.Zotero) -> zotero.Zotero:
+    """
+    Give a Zotero client a connection pool sized for the worker threads.
+
+    pyzotero's default httpx client keeps only 20 idle connections, so with
+    more worker threads than that, finished requests close their connection
+    and the next call pays for a new TCP and TLS handshake.
+
+    The replacement keeps every setting of the client pyzotero built (headers,
+    timeout, redirects, proxy environment) and comes from the same httpx
+    package, which newer pyzotero releases vendor, so pyzotero still turns
+    its errors into pyzotero exceptions.
+
+    Args:
+        client: Freshly constructed Zotero client
+
+    Returns:
+        The same client, with its HTTP client replaced
+    """
+    old = getattr(client, "client", None)
+    if old is None:
+        return client
+
+    http = importlib.import_module(type(old).__module__.partition(".")[0])
+    limits = http.Limits(
+        max_connections=ZOTERO_MCP_THREADS * 2,
+        max_keepalive_connections=ZOTERO_MCP_THREADS,
+    )
+    client.client = http.Client(
+        headers=old.headers,
+        timeout=old.timeout,
+        follow_redirects=old.follow_redirects,
+        trust_env=old.trust_env,
+        # Also sizes the transports for proxies taken from the environment
+        limits=limits,
+        # Retries failed connection attempts; pyzotero handles 429 backoff itself
+        transport=http.HTTPTransport(limits=limits, trust_env=old.trust_env, retries=3),
+    )
+    old.close()
+    return client
+
+
+class _ClientCopy(zotero.Zotero):
+    """Copy of a Zotero client that shares the original's HTTP connection pool."""
+
+    def __del__(self):
+        # The connection pool belongs to the original client; leave it open
+        pass
+
+
+class ThreadLocalClient(threading.local):
+    """
+    Zotero client that gives each thread its own copy.
+
+    pyzotero keeps per-request state (URL parameters, the last response) on
+    the client, so concurrent calls must not share one instance. Each thread
+    gets a shallow copy that still uses the original's connection pool.
+    """
+
+    def __init__(self, client: zotero.Zotero):
+        self.client = object.__new__(_ClientCopy)
+        self.client.__dict__.update(client.__dict__)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
 
 def init_zotero_client():
     """Initialize the Zotero client with credentials from environment."""
@@ -45,13 +222,17 @@ def init_zotero_client():
         logger.error("ZOTERO_API_KEY environment variable not set")
         return
 
+    # A single client is created and reused for every call. pyzotero keeps an
+    # HTTP connection pool per instance, so requests share keep-alive
+    # connections instead of paying for a TLS handshake each time. The pool is
+    # sized so every worker thread can hold a connection open.
     try:
         # Prioritize user library over group library
         if user_id:
-            zot = zotero.Zotero(user_id, 'user', api_key)
+            zot = ThreadLocalClient(_size_connection_pool(zotero.Zotero(user_id, 'user', api_key)))
             logger.info(f"Initialized Zotero client for user {user_id}")
         elif group_id:
-            zot = zotero.Zotero(group_id, 'group', api_key)
+            zot = ThreadLocalClient(_size_connection_pool(zotero.Zotero(group_id, 'group', api_key)))
             logger.info(f"Initialized Zotero client for group {group_id}")
         else:
             logger.error("Either ZOTERO_USER_ID or ZOTERO_GROUP_ID must be set")
@@ -65,56 +246,456 @@ def ensure_client():
         raise RuntimeError("Zotero client not initialized. Check API credentials.")
 
 
+async def run_blocking(fn, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on a Zotero worker thread and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_zotero_executor, functools.partial(fn, *args, **kwargs))
+
+
+# Resource routes for the legacy bridge: exact URIs, and compiled patterns for
+# URI templates, each mapped to the resource function
+_RESOURCE_URIS: dict[str, Any] = {}
+_RESOURCE_TEMPLATES: list[tuple["re.Pattern[str]", Any]] = []
+
+
+def zotero_resource(uri: str):
+    """
+    Register a blocking function as an MCP resource served from a worker thread.
+
+    The URI is also added to the legacy bridge's routing table, so legacy
+    reads are matched with one precompiled regex instead of FastMCP's
+    per-request template lookup.
+
+    Args:
+        uri: Resource URI, optionally with {name} template parameters
+    """
+    def register(fn):
+        handler = mcp.resource(uri)(in_worker_thread(fn))
+        if "{" in uri:
+            pattern = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(uri))
+            _RESOURCE_TEMPLATES.append((re.compile(pattern), handler))
+        else:
+            _RESOURCE_URIS[uri] = handler
+        return handler
+    return register
+
+
+def in_worker_thread(fn):
+    """
+    Make a blocking resource or tool function a coroutine run on a worker thread.
+
+    FastMCP calls plain functions directly on the event loop, where a Zotero
+    request would stall every other client until it returned.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await run_blocking(fn, *args, **kwargs)
+    return wrapper
+
+
+def to_json(data: Any) -> str:
+    """
+    Serialize a response for an MCP client, using orjson when it is installed.
+
+    Args:
+        data: JSON-compatible data returned by the Zotero API
+
+    Returns:
+        Compact JSON string, or JSON indented by two spaces when
+        ZOTERO_MCP_DEBUG is set
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+        return orjson.dumps(data, option=option).decode()
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+# Fixed-shape tool responses. With msgspec installed they are encoded by
+# per-struct encoders that skip building and walking an intermediate dict.
+if msgspec is not None:
+    class SearchResult(msgspec.Struct):
+        query: str
+        count: int
+        results: list
+
+    class Overview(msgspec.Struct):
+        collections: list
+        top_items: list
+        recent_items: list
+
+    _struct_encoder = msgspec.json.Encoder()
+
+
+def struct_to_json(value: Any) -> str:
+    """
+    Serialize a response struct, indenting it when ZOTERO_MCP_DEBUG is set.
+
+    Args:
+        value: A msgspec Struct instance
+
+    Returns:
+        JSON string of the struct
+    """
+    payload = _struct_encoder.encode(value)
+    if PRETTY_JSON:
+        payload = msgspec.json.format(payload, indent=2)
+    return payload.decode()
+
+
+def cached_schema(key: str, fetch) -> str:
+    """
+    Return the JSON response for a schema lookup, fetching it at most once a day.
+
+    Args:
+        key: Cache key for the lookup
+        fetch: Callable that retrieves the data from Zotero
+
+    Returns:
+        JSON string of the (possibly cached) data
+    """
+    global _schema_cache
+
+    with _schema_cache_lock:
+        if _schema_cache is None:
+            try:
+                with open(SCHEMA_CACHE_PATH, encoding="utf-8") as f:
+                    _schema_cache = json.load(f)
+            except (OSError, ValueError):
+                _schema_cache = {}
+
+        entry = _schema_cache.get(key)
+        if entry is not None and time.time() - entry[0] < SCHEMA_CACHE_TTL:
+            return entry[1]
+
+    payload = to_json(fetch())
+
+    # Hold the lock while saving so no other thread changes the dict under
+    # json.dump, and give each write its own temporary file.
+    with _schema_cache_lock:
+        _schema_cache[key] = [time.time(), payload]
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(SCHEMA_CACHE_PATH), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=os.path.dirname(SCHEMA_CACHE_PATH), suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(_schema_cache, f)
+            os.replace(tmp_path, SCHEMA_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not save schema cache: {str(e)}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    return payload
+
+
+def library_version() -> int:
+    """
+    Return the library version, asking Zotero at most once per LIBRARY_VERSION_TTL.
+
+    Returns:
+        The last known version of the Zotero library
+    """
+    global _library_version
+
+    now = time.monotonic()
+    if _library_version is None or now - _library_version[1] >= LIBRARY_VERSION_TTL:
+        _library_version = (zot.last_modified_version(), now)
+    return _library_version[0]
+
+
+def invalidate_library_version() -> None:
+    """Make the next cached read ask Zotero for the version after a write."""
+    global _library_version
+    _library_version = None
+
+
+def cached_by_version(key: str, fetch) -> str:
+    """
+    Return the JSON response for a library read, refetching only after a change.
+
+    Zotero bumps the library version on every write, so a response cached at
+    the current version is still accurate. Checking the version is a single
+    small request instead of a full fetch, and is itself cached briefly.
+
+    Args:
+        key: Cache key identifying the endpoint and its parameters
+        fetch: Callable that retrieves the data from Zotero
+
+    Returns:
+        JSON string of the (possibly cached) data
+    """
+    version = library_version()
+    with _library_cache_lock:
+        entry = _library_cache.get(key)
+        if entry is not None and entry[0] == version:
+            _library_cache.move_to_end(key)
+            return entry[1]
+
+    payload = to_json(fetch())
+    with _library_cache_lock:
+        _library_cache[key] = (version, payload)
+        _library_cache.move_to_end(key)
+        if len(_library_cache) > LIBRARY_CACHE_SIZE:
+            _library_cache.popitem(last=False)
+    return payload
+
+
+def cached_citation(item_keys: list[str], style: str, fetch) -> str:
+    """
+    Return a formatted citation or bibliography, re-rendering only after a change.
+
+    Zotero's citation output depends only on the items and the style, so a
+    rendering made at the current library version can be reused.
+
+    Args:
+        item_keys: Keys of the items being cited
+        style: Citation style
+        fetch: Callable that renders the citation through Zotero
+
+    Returns:
+        Formatted citation string
+    """
+    key = (tuple(sorted(item_keys)), style)
+    version = library_version()
+    with _citation_lock:
+        entry = _citation_cache.get(key)
+        if entry is not None and entry[0] == version:
+            _citation_cache.move_to_end(key)
+            return entry[1]
+
+    citation = fetch()
+    with _citation_lock:
+        _citation_cache[key] = (version, citation)
+        _citation_cache.move_to_end(key)
+        if len(_citation_cache) > CITATION_CACHE_SIZE:
+            _citation_cache.popitem(last=False)
+    return citation
+
+
+def fetch_pages(
+    method: str, *args: Any, start: int = 0, limit: int = ZOTERO_READ_PAGE_SIZE, **params: Any
+) -> list[dict[str, Any]]:
+    """
+    Fetch up to `limit` items from a paged pyzotero listing.
+
+    The first page is fetched on its own to learn the total number of results
+    from the Total-Results header; any further pages are then requested
+    concurrently instead of one after another.
+
+    Args:
+        method: Name of the pyzotero listing method (e.g., "top", "collection_items")
+        *args: Positional arguments for the method
+        start: Index of the first item to return
+        limit: Maximum number of items to return
+        **params: Extra query parameters for the method (e.g., since)
+
+    Returns:
+        List of items in listing order
+    """
+    def fetch_page(offset: int) -> tuple[list[dict[str, Any]], Any]:
+        # zot hands each thread its own client, so the response read back
+        # here is the one for this page
+        page_limit = min(ZOTERO_READ_PAGE_SIZE, start + limit - offset)
+        return getattr(zot, method)(*args, limit=page_limit, start=offset, **params), zot.request
+
+    items, response = fetch_page(start)
+    headers = getattr(response, "headers", None) or {}
+    total = int(headers.get("Total-Results", start + len(items)))
+    offsets = range(start + ZOTERO_READ_PAGE_SIZE, min(start + limit, total), ZOTERO_READ_PAGE_SIZE)
+    if not offsets:
+        return items
+
+    with ThreadPoolExecutor(max_workers=ZOTERO_READ_WORKERS) as pool:
+        for page, _ in pool.map(fetch_page, offsets):
+            items.extend(page)
+    return items
+
+
+def _search_text(item: dict[str, Any]) -> str:
+    """Text a quick search matches against: title, creator names and year."""
+    data = item.get("data", {})
+    creators = " ".join(
+        " ".join(filter(None, (creator.get("firstName"), creator.get("lastName"), creator.get("name"))))
+        for creator in data.get("creators", [])
+    )
+    year = item.get("meta", {}).get("parsedDate", "")[:4]
+    return f"{data.get('title', '')} {creators} {year}".lower()
+
+
+def search_index() -> list[tuple[str, dict[str, Any]]]:
+    """
+    Return the local search index, updating it if the library has changed.
+
+    The first call fetches every item. Later updates fetch only the items
+    modified since the indexed version, and the keys deleted since then,
+    instead of the whole library again.
+
+    Returns:
+        List of (search text, item) pairs in the API's default order
+    """
+    global _search_index
+
+    version = library_version()
+    index = _search_index
+    if index is not None and index["version"] == version:
+        return index["entries"]
+
+    with _search_index_lock:
+        # Another thread may have updated the index while this one waited
+        index = _search_index
+        if index is not None and index["version"] == version:
+            return index["entries"]
+
+        if index is None:
+            items = fetch_pages("items", limit=sys.maxsize)
+            entries = [(_search_text(item), item) for item in items]
+        else:
+            # Trashed items are fetched too, so that moving one to the trash
+            # drops it from the index
+            changed = fetch_pages("items", limit=sys.maxsize, since=index["version"], includeTrashed=1)
+            removed = set(zot.deleted(since=index["version"]).get("items", []))
+            removed.update(item["key"] for item in changed)
+            # The default order is most recently modified first
+            entries = [(_search_text(item), item) for item in changed if not item["data"].get("deleted")]
+            entries.extend(entry for entry in index["entries"] if entry[1]["key"] not in removed)
+
+        _search_index = {"version": version, "entries": entries}
+        return entries
+
+
+def build_item(
+    item_type: str,
+    title: str,
+    creators: Optional[list[dict[str, str]]] = None,
+    additional_fields: Optional[dict[str, Any]] = None
+) -> dict[str, Any]:
+    """Fill in a Zotero item template for a new item."""
+    # Create item template
+    template = zot.item_template(item_type)
+
+    # Set title
+    template["title"] = title
+
+    # Set creators
+    if creators:
+        template["creators"] = creators
+
+    # Set additional fields
+    if additional_fields:
+        for key, value in additional_fields.items():
+            template[key] = value
+
+    return template
+
+
+def project_fields(item: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+    """
+    Keep only the requested fields of a Zotero item.
+
+    Args:
+        item: Item as returned by the Zotero API
+        fields: Dotted field paths to keep (e.g., ["key", "data.title"])
+
+    Returns:
+        A copy of the item containing only the requested fields
+    """
+    projected: dict[str, Any] = {}
+    for field in fields:
+        *parents, leaf = field.split(".")
+        source, target = item, projected
+        for part in parents:
+            source = source.get(part) if isinstance(source, dict) else None
+            if source is None:
+                break
+            target = target.setdefault(part, {})
+        else:
+            if isinstance(source, dict) and leaf in source:
+                target[leaf] = source[leaf]
+    return projected
+
+
 # ============================================================================
 # RESOURCES - Read-only data access
 # ============================================================================
 
-@mcp.resource("zotero://collections")
+@zotero_resource("zotero://collections")
 def get_collections() -> str:
     """List of collections in the Zotero library."""
     ensure_client()
-    collections = zot.collections()
-    return json.dumps(collections, indent=2)
+    return cached_by_version("collections", zot.collections)
 
 
-@mcp.resource("zotero://items/top")
+@zotero_resource("zotero://items/top")
 def get_top_items() -> str:
     """Top-level items in the Zotero library."""
     ensure_client()
-    items = zot.top(limit=50)
-    return json.dumps(items, indent=2)
+    return cached_by_version("items/top", lambda: zot.top(limit=RESOURCE_PAGE_SIZE))
 
 
-@mcp.resource("zotero://items/recent")
+@zotero_resource("zotero://items/top/page/{start}")
+def get_top_items_page(start: str) -> str:
+    """A page of top-level items in the Zotero library, starting at the given offset."""
+    ensure_client()
+    offset = int(start)
+    return cached_by_version(
+        f"items/top?start={offset}",
+        lambda: zot.top(limit=RESOURCE_PAGE_SIZE, start=offset)
+    )
+
+
+@zotero_resource("zotero://items/recent")
 def get_recent_items() -> str:
     """Recently added or modified items in the Zotero library."""
     ensure_client()
-    items = zot.items(limit=20, sort="dateModified", direction="desc")
-    return json.dumps(items, indent=2)
+    return cached_by_version(
+        "items/recent",
+        lambda: zot.items(limit=20, sort="dateModified", direction="desc")
+    )
 
 
-@mcp.resource("zotero://collections/{collection_key}/items")
+@zotero_resource("zotero://collections/{collection_key}/items")
 def get_collection_items(collection_key: str) -> str:
-    """Items in a specific Zotero collection."""
+    """The first 100 items in a specific Zotero collection; see the paged resource for more."""
+    ensure_client()
+    return cached_by_version(
+        f"collections/{collection_key}/items",
+        lambda: zot.collection_items(collection_key, limit=ZOTERO_READ_PAGE_SIZE)
+    )
+
+
+@zotero_resource("zotero://collections/{collection_key}/items/page/{start}")
+def get_collection_items_page(collection_key: str, start: str) -> str:
+    """A page of items in a specific Zotero collection, starting at the given offset."""
     ensure_client()
-    items = zot.collection_items(collection_key)
-    return json.dumps(items, indent=2)
+    offset = int(start)
+    return cached_by_version(
+        f"collections/{collection_key}/items?start={offset}",
+        lambda: zot.collection_items(collection_key, limit=RESOURCE_PAGE_SIZE, start=offset)
+    )
 
 
-@mcp.resource("zotero://items/{item_key}")
+@zotero_resource("zotero://items/{item_key}")
 def get_item(item_key: str) -> str:
     """Details of a specific Zotero item."""
     ensure_client()
-    item = zot.item(item_key)
-    return json.dumps(item, indent=2)
+    return cached_by_version(f"items/{item_key}", lambda: zot.item(item_key))
 
 
-@mcp.resource("zotero://items/{item_key}/citation/{style}")
+@zotero_resource("zotero://items/{item_key}/citation/{style}")
 def get_item_citation(item_key: str, style: str) -> str:
     """Citation for a specific Zotero item in a specific style."""
     ensure_client()
-    citation = zot.item(item_key, format="citation", style=style)
-    return citation
+    return cached_citation(
+        [item_key], style,
+        lambda: zot.item(item_key, format="citation", style=style)
+    )
 
 
 # ============================================================================
@@ -122,10 +703,12 @@ def get_item_citation(item_key: str, style: str) -> str:
 # ============================================================================
 
 @mcp.tool()
+@in_worker_thread
 def search_items(
     query: str,
     collection_key: Optional[str] = None,
-    limit: int = 20
+    limit: int = 20,
+    fields: Optional[list[str]] = None
 ) -> str:
     """
     Search for items in the Zotero library.
@@ -134,6 +717,8 @@ def search_items(
         query: Search query string
         collection_key: Optional collection key to search within
         limit: Maximum number of results to return (default: 20)
+        fields: Optional dotted field paths to return for each item
+            (e.g., ["key", "data.title"]); all fields if omitted
 
     Returns:
         JSON string containing search results
@@ -144,8 +729,21 @@ def search_items(
 
     if collection_key:
         items = zot.collection_items_top(collection_key, **search_params)
-    else:
+    elif '"' in query:
+        # Phrase searches are left to Zotero's own query parsing
         items = zot.items(**search_params)
+    else:
+        # Like Zotero's quick search, every word must match
+        terms = query.lower().split()
+        matches = (item for text, item in search_index() if all(term in text for term in terms))
+        items = list(islice(matches, limit))
+
+    items = items[:limit]
+    if fields:
+        items = [project_fields(item, fields) for item in items]
+
+    if msgspec is not None:
+        return struct_to_json(SearchResult(query, len(items), items))
 
     result = {
         "query": query,
@@ -153,10 +751,76 @@ def search_items(
         "results": items
     }
 
-    return json.dumps(result, indent=2)
+    return to_json(result)
+
+
+@mcp.tool()
+@in_worker_thread
+def list_items(
+    collection_key: Optional[str] = None,
+    limit: int = 50,
+    fields: Optional[list[str]] = None,
+    start: int = 0
+) -> str:
+    """
+    List top-level items in the library or in a collection.
+
+    Args:
+        collection_key: Optional collection key to list items from
+        limit: Maximum number of items to return (default: 50)
+        start: Index of the first item to return, for paging (default: 0)
+        fields: Optional dotted field paths to return for each item
+            (e.g., ["key", "data.title"]); all fields if omitted
+
+    Returns:
+        JSON string containing the items
+    """
+    ensure_client()
+
+    if collection_key:
+        items = fetch_pages("collection_items", collection_key, start=start, limit=limit)
+    else:
+        items = fetch_pages("top", start=start, limit=limit)
+
+    items = items[:limit]
+    if fields:
+        items = [project_fields(item, fields) for item in items]
+
+    return to_json(items)
+
+
+@mcp.tool()
+async def get_overview() -> str:
+    """
+    Get the collections, top-level items and recent items of the library at once.
+
+    The three lookups run concurrently, so the overview takes about as long as
+    the slowest of them rather than their sum.
+
+    Returns:
+        JSON string containing collections, top items and recent items
+    """
+    ensure_client()
+
+    # zot is looked up on each worker thread, so each call uses its own client
+    collections, top_items, recent_items = await asyncio.gather(
+        run_blocking(lambda: zot.collections()),
+        run_blocking(lambda: zot.top(limit=50)),
+        run_blocking(lambda: zot.items(limit=20, sort="dateModified", direction="desc"))
+    )
+
+    if msgspec is not None:
+        return struct_to_json(Overview(collections, top_items, recent_items))
+
+    return to_json({
+        "collections": collections,
+        "top_items": top_items,
+        "recent_items": recent_items
+    })
 
 
 @mcp.tool()
+@in_worker_thread
 def get_citation(item_key: str, style: str = "apa") -> str:
     """
     Get citation for a specific item.
@@ -169,11 +833,14 @@ def get_citation(item_key: str, style: str = "apa") -> str:
         Formatted citation string
     """
     ensure_client()
-    citation = zot.item(item_key, format="citation", style=style)
-    return citation
+    return cached_citation(
+        [item_key], style,
+        lambda: zot.item(item_key, format="citation", style=style)
+    )
 
 
 @mcp.tool()
+@in_worker_thread
 def add_item(
     item_type: str,
     title: str,
@@ -196,33 +863,65 @@ def add_item(
     """
     ensure_client()
 
-    # Create item template
-    template = zot.item_template(item_type)
-
-    # Set title
-    template["title"] = title
-
-    # Set creators
-    if creators:
-        template["creators"] = creators
-
-    # Set additional fields
-    if additional_fields:
-        for key, value in additional_fields.items():
-            template[key] = value
-
     # Create item
+    template = build_item(item_type, title, creators, additional_fields)
     response = zot.create_items([template])
 
     # Add to collection if specified
     if collection_key and response.get("success"):
-        item_key = response["successful"]["0"]["key"]
-        zot.addto_collection(collection_key, [item_key])
+        # pyzotero needs the created item, with its version and collections
+        zot.addto_collection(collection_key, response["successful"]["0"])
+
+    invalidate_library_version()
+    return to_json(response)
+
+
+@mcp.tool()
+@in_worker_thread
+def add_items(items: list[dict[str, Any]]) -> str:
+    """
+    Add several new items to the Zotero library at once.
+
+    Args:
+        items: List of items, each with the same fields as add_item
+            (item_type, title, and optional creators, collection_key, additional_fields)
+
+    Returns:
+        JSON string with the combined creation response, indexed by position in items
+    """
+    ensure_client()
+
+    templates = [
+        build_item(
+            item["item_type"],
+            item["title"],
+            item.get("creators"),
+            item.get("additional_fields")
+        )
+        for item in items
+    ]
+
+    combined = {"success": {}, "successful": {}, "unchanged": {}, "failed": {}}
+    for start in range(0, len(templates), ZOTERO_WRITE_BATCH_SIZE):
+        response = zot.create_items(templates[start:start + ZOTERO_WRITE_BATCH_SIZE])
+
+        # Re-key each chunk's results by position in the full list
+        for status, results in response.items():
+            for index, value in results.items():
+                combined.setdefault(status, {})[str(start + int(index))] = value
+
+    # Add items to their collections
+    for index, created in combined["successful"].items():
+        collection_key = items[int(index)].get("collection_key")
+        if collection_key:
+            zot.addto_collection(collection_key, created)
 
-    return json.dumps(response, indent=2)
+    invalidate_library_version()
+    return to_json(combined)
 
 
 @mcp.tool()
+@in_worker_thread
 def get_bibliography(item_keys: list[str], style: str = "apa") -> str:
     """
     Get bibliography for multiple items.
@@ -235,11 +934,14 @@ def get_bibliography(item_keys: list[str], style: str = "apa") -> str:
         Formatted bibliography string
     """
     ensure_client()
-    bibliography = zot.bibliography(item_keys, style=style)
-    return bibliography
+    return cached_citation(
+        item_keys, style,
+        lambda: zot.bibliography(item_keys, style=style)
+    )
 
 
 @mcp.tool()
+@in_worker_thread
 def create_collection(name: str, parent_key: Optional[str] = None) -> str:
     """
     Create a new collection in the Zotero library.
@@ -258,13 +960,16 @@ def create_collection(name: str, parent_key: Optional[str] = None) -> str:
         collection_data["parentCollection"] = parent_key
 
     response = zot.create_collections([collection_data])
-    return json.dumps(response, indent=2)
+    invalidate_library_version()
+    return to_json(response)
 
 
 @mcp.tool()
+@in_worker_thread
 def update_item(
     item_key: str,
-    updates: dict[str, Any]
+    updates: dict[str, Any],
+    version: Optional[int] = None
 ) -> str:
     """
     Update an existing item in the Zotero library.
@@ -272,12 +977,20 @@ def update_item(
     Args:
         item_key: The Zotero item key to update
         updates: Dictionary of fields to update
+        version: Optional current version of the item; when given, the
+            changes are sent as a patch without fetching the item first
 
     Returns:
         JSON string with update response
     """
     ensure_client()
 
+    if version is not None:
+        # Zotero rejects the patch if the item changed since this version
+        response = zot.update_item({"key": item_key, "version": version, **updates})
+        invalidate_library_version()
+        return to_json(response)
+
     # Get the existing item
     item = zot.item(item_key)
 
@@ -287,33 +1000,39 @@ def update_item(
 
     # Update the item
     response = zot.update_item(item)
-    return json.dumps(response, indent=2)
+    invalidate_library_version()
+    return to_json(response)
 
 
 @mcp.tool()
-def delete_item(item_key: str) -> str:
+@in_worker_thread
+def delete_item(item_key: str, version: Optional[int] = None) -> str:
     """
     Delete an item from the Zotero library.
 
     Args:
         item_key: The Zotero item key to delete
+        version: Optional current version of the item; when given, the
+            item is deleted without fetching it first
 
     Returns:
         Success message
     """
     ensure_client()
 
-    # Get item version for deletion
-    item = zot.item(item_key)
-    version = item.get('version')
+    if version is None:
+        # Get item version for deletion
+        version = zot.item(item_key).get('version')
 
-    # Delete the item
-    zot.delete_item(item, version=version)
+    # Delete the item; Zotero refuses if it changed since this version
+    zot.delete_item({"key": item_key, "version": version})
+    invalidate_library_version()
 
-    return json.dumps({"success": True, "message": f"Item {item_key} deleted"})
+    return to_json({"success": True, "message": f"Item {item_key} deleted"})
 
 
 @mcp.tool()
+@in_worker_thread
 def get_item_types() -> str:
     """
     Get list of all available Zotero item types.
@@ -322,11 +1041,11 @@ def get_item_types() -> str:
         JSON string containing all item types
     """
     ensure_client()
-    item_types = zot.item_types()
-    return json.dumps(item_types, indent=2)
+    return cached_schema("item_types", zot.item_types)
 
 
 @mcp.tool()
+@in_worker_thread
 def get_item_fields(item_type: str) -> str:
     """
     Get available fields for a specific item type.
@@ -338,19 +1057,478 @@ def get_item_fields(item_type: str) -> str:
         JSON string containing available fields
     """
     ensure_client()
-    fields = zot.item_type_fields(item_type)
-    return json.dumps(fields, indent=2)
+    return cached_schema(f"item_type_fields:{item_type}", lambda: zot.item_type_fields(item_type))
+
+
+# ============================================================================
+# LEGACY JSON-RPC - The dialect spoken by the bundled example clients
+# ============================================================================
+#
+# The example clients send plain JSON-RPC requests (list_resources,
+# read_resource, list_tools, call_tool) without the MCP initialize handshake.
+# These handlers answer them from the same FastMCP registrations, so both
+# transports expose exactly the same resources and tools.
+
+# JSON codec for legacy frames: orjson encodes straight to bytes and parses
+# bytes without decoding to str; the stdlib fallback matches its compact output
+if orjson is not None:
+    def _dumps(message: Any) -> bytes:
+        return orjson.dumps(message, default=_encoded_fragment)
+    _loads = orjson.loads
+else:
+    def _dumps(message: Any) -> bytes:
+        return json.dumps(message, separators=(",", ":")).encode()
+    _loads = json.loads
+
+
+class _Encoded:
+    """A value in a legacy response, together with its JSON encoding."""
+
+    __slots__ = ("value", "encoded")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.encoded = orjson.dumps(value)
+
+
+def _encoded_fragment(value: Any) -> Any:
+    """orjson fallback that splices an already encoded value."""
+    if isinstance(value, _Encoded):
+        return orjson.Fragment(value.encoded)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _pre_encoded(value: Any) -> Any:
+    """Encode a value once for reuse, when orjson can splice it into a frame."""
+    if hasattr(orjson, "Fragment"):
+        return _Encoded(value)
+    return value
+
+
+# id(text) -> encoded text, for the most recently read large resources
+_encoded_texts: "OrderedDict[int, _Encoded]" = OrderedDict()
+
+
+def _encoded_text(text: str) -> Any:
+    """
+    Wrap a large resource text so its JSON encoding is computed only once.
+
+    Cached resources return the same string object until the library
+    changes, so the encoding is looked up by identity. Needs orjson 3.10+
+    for orjson.Fragment; otherwise the text is returned unchanged.
+
+    Args:
+        text: Text returned by a resource
+
+    Returns:
+        The text itself, or an _Encoded carrying its encoding
+    """
+    if len(text) < LEGACY_ENCODED_TEXT_MIN or not hasattr(orjson, "Fragment"):
+        return text
+    entry = _encoded_texts.get(id(text))
+    if entry is not None and entry.value is text:
+        _encoded_texts.move_to_end(id(text))
+        return entry
+    entry = _encoded_texts[id(text)] = _Encoded(text)
+    if len(_encoded_texts) > LEGACY_ENCODED_TEXT_CACHE:
+        _encoded_texts.popitem(last=False)
+    return entry
+
+
+def _dump_models(models) -> list[dict[str, Any]]:
+    """Convert MCP SDK models to plain JSON-compatible dictionaries."""
+    return [model.model_dump(mode="json", by_alias=True, exclude_none=True) for model in models]
+
+
+# Resources and tools are all registered at import time, so their listings
+# never change while the server runs; each is dumped and encoded once and
+# reused, leaving only the response envelope to encode per request.
+_legacy_listings: dict[str, Any] = {}
+
+
+async def _cached_listing(name: str, list_models) -> Any:
+    """Return a listing result, dumping the SDK models on first use only."""
+    listing = _legacy_listings.get(name)
+    if listing is None:
+        listing = _legacy_listings[name] = _pre_encoded({name: _dump_models(await list_models())})
+    return listing
+
+
+async def prepare_legacy_listings() -> None:
+    """Build every listing before the first request arrives."""
+    await _legacy_list_resources({})
+    await _legacy_list_resource_templates({})
+    await _legacy_list_tools({})
+
+
+async def _legacy_list_resources(params: dict[str, Any]) -> dict[str, Any]:
+    return await _cached_listing("resources", mcp.list_resources)
+
+
+async def _legacy_list_resource_templates(params: dict[str, Any]) -> dict[str, Any]:
+    return await _cached_listing("resourceTemplates", mcp.list_resource_templates)
+
+
+async def _legacy_read_resource(params: dict[str, Any]) -> dict[str, Any]:
+    uri = params["uri"]
+    handler = _RESOURCE_URIS.get(uri)
+    if handler is not None:
+        text = await handler()
+    else:
+        for pattern, handler in _RESOURCE_TEMPLATES:
+            match = pattern.fullmatch(uri)
+            if match:
+                text = await handler(**match.groupdict())
+                break
+        else:
+            raise ValueError(f"Unknown resource: {uri}")
+    return {"contents": [{"uri": uri, "mimeType": "text/plain", "text": _encoded_text(text)}]}
+
+
+async def _legacy_list_tools(params: dict[str, Any]) -> dict[str, Any]:
+    return await _cached_listing("tools", mcp.list_tools)
+
+
+async def _legacy_call_tool(params: dict[str, Any]) -> dict[str, Any]:
+    result = await mcp.call_tool(params["name"], params.get("arguments") or {})
+    # Newer SDK versions return (content, structured_content)
+    if isinstance(result, tuple):
+        result = result[0]
+    return {"content": _dump_models(result)}
+
+
+_LEGACY_METHODS = {
+    "list_resources": _legacy_list_resources,
+    "list_resource_templates": _legacy_list_resource_templates,
+    "read_resource": _legacy_read_resource,
+    "list_tools": _legacy_list_tools,
+    "call_tool": _legacy_call_tool,
+}
+
+
+def _legacy_error(code: int, message: str, request_id: Any = None) -> dict[str, Any]:
+    """Build a JSON-RPC error response."""
+    return {"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": request_id}
+
+
+async def handle_legacy_request(request: Any) -> dict[str, Any]:
+    """
+    Answer a single legacy JSON-RPC request.
+
+    Args:
+        request: The decoded JSON-RPC request; anything but an object with a
+            string method is answered with an Invalid Request error
+
+    Returns:
+        The JSON-RPC response
+    """
+    if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+        return _legacy_error(-32600, "Invalid Request")
+
+    request_id = request.get("id")
+    handler = _LEGACY_METHODS.get(request.get("method"))
+    if handler is None:
+        return _legacy_error(-32601, f"Method not found: {request.get('method')}", request_id)
+
+    try:
+        result = await handler(request.get("params") or {})
+    except Exception as e:
+        logger.error("Error handling %s: %s", request.get("method"), e)
+        return _legacy_error(-32000, str(e), request_id)
+
+    return {"jsonrpc": "2.0", "result": result, "id": request_id}
+
+
+async def serve_legacy(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    transport: str = "json"
+) -> None:
+    """
+    Serve legacy JSON-RPC requests until the reader reaches end of file.
+
+    With the "json" transport messages are newline-delimited JSON. With
+    "framed" and "msgpack" each message is a JSON or MessagePack document
+    behind a 4-byte big-endian length prefix, so no line scanning is needed
+    and payloads may contain newlines. A JSON array of requests is answered
+    with an array of responses. Messages that are not request objects, and
+    empty arrays, are answered with an Invalid Request error.
+
+    Each request is handled in its own task while the next one is read, so
+    responses may be written out of order; clients match them by id. A
+    single writer task sends every response that is ready in one write.
+
+    Args:
+        reader: Stream the requests arrive on
+        writer: Stream the responses are written to
+        transport: One of LEGACY_TRANSPORTS
+    """
+    if transport == "msgpack":
+        encode = lambda response: msgpack.packb(response, default=lambda encoded: encoded.value)
+        decode = lambda payload: msgpack.unpackb(payload, raw=False)
+    else:
+        encode = _dumps
+        decode = _loads
+
+    outbox: asyncio.Queue = asyncio.Queue()
+    pending: set[asyncio.Task] = set()
+
+    def send(response: Any) -> None:
+        payload = encode(response)
+        if transport == "json":
+            outbox.put_nowait(payload + b"\n")
+        else:
+            outbox.put_nowait(struct.pack(">I", len(payload)) + payload)
+
+    async def flush() -> None:
+        # Responses finished in the same event loop tick go out in one write
+        while True:
+            frames = [await outbox.get()]
+            while not outbox.empty():
+                frames.append(outbox.get_nowait())
+            done = frames[-1] is None
+            if done:
+                frames.pop()
+            try:
+                writer.writelines(frames)
+                await writer.drain()
+            except ConnectionError:
+                return
+            if done:
+                return
+
+    async def respond(request: Any) -> None:
+        if isinstance(request, list) and not request:
+            send(_legacy_error(-32600, "Invalid Request"))
+        elif isinstance(request, list):
+            send(list(await asyncio.gather(*(handle_legacy_request(r) for r in request))))
+        else:
+            send(await handle_legacy_request(request))
+
+    # Encode the listings before reading the first request; this is a no-op
+    # once they are cached, so later connections start straight away
+    await prepare_legacy_listings()
+
+    flusher = asyncio.create_task(flush())
+
+    while True:
+        try:
+            if transport == "json":
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                request = decode(line)
+            else:
+                (length,) = struct.unpack(">I", await reader.readexactly(4))
+                request = decode(await reader.readexactly(length))
+        except asyncio.IncompleteReadError:
+            break
+        except ValueError as e:
+            send(_legacy_error(-32700, f"Parse error: {str(e)}"))
+            continue
+
+        task = asyncio.create_task(respond(request))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    # Let requests still in progress write their responses before returning
+    if pending:
+        await asyncio.gather(*pending)
+    outbox.put_nowait(None)
+    await flusher
+
+
+async def run_legacy_stdio(transport: str = "json") -> None:
+    """
+    Serve legacy JSON-RPC over stdin/stdout.
+
+    A one-line JSON handshake naming the wire format is written first, so a
+    client that asked for MessagePack can fall back to framed JSON when
+    msgpack is not installed on the server side.
+
+    Args:
+        transport: The wire format the client asked for
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=2 ** 24)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    pipe, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    writer = asyncio.StreamWriter(pipe, protocol, reader, loop)
+
+    transport = await _write_handshake(writer, transport)
+
+    logger.info(f"Zotero MCP server running on stdio (legacy JSON-RPC, {transport})")
+    await serve_legacy(reader, writer, transport)
+
+
+async def _write_handshake(writer: asyncio.StreamWriter, requested: Optional[str]) -> str:
+    """Announce the wire format that will be used in one JSON line and return it."""
+    if requested == "msgpack" and msgpack is None:
+        transport = "framed"
+    elif requested in LEGACY_TRANSPORTS:
+        transport = requested
+    else:
+        transport = "json"
+
+    writer.write(_dumps({"transport": transport}) + b"\n")
+    await writer.drain()
+    return transport
+
+
+class _SocketLines:
+    """
+    Line-oriented text file interface over a socket connection.
+
+    stdio_server() exchanges MCP messages as lines of text through async file
+    objects; this one lets it serve a socket connection instead of stdio.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, first_line: bytes):
+        self._reader = reader
+        self._writer = writer
+        self._pending: Optional[bytes] = first_line
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        line, self._pending = self._pending, None
+        if line is None:
+            line = await self._reader.readline()
+        if not line:
+            raise StopAsyncIteration
+        return line.decode("utf-8", errors="replace")
+
+    async def write(self, text: str) -> None:
+        self._writer.write(text.encode())
+        await self._writer.drain()
+
+    async def flush(self) -> None:
+        pass
+
+
+async def serve_mcp(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, first_line: bytes) -> None:
+    """
+    Serve the standard MCP protocol on one socket connection.
+
+    Args:
+        reader: Stream the client's messages arrive on
+        writer: Stream the server's messages are written to
+        first_line: The client's first message, already read from the stream
+    """
+    lines = _SocketLines(reader, writer, first_line)
+    server = mcp._mcp_server
+    async with stdio_server(lines, lines) as (read_stream, write_stream):
+        await server.run(read_stream, write_stream, server.create_initialization_options())
+
+
+async def _handle_socket_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Serve one socket connection in whichever protocol the client speaks."""
+    # MCP clients open with their initialize request; the bundled clients
+    # open with a line like {"transport": "msgpack"}
+    line = await reader.readline()
+    try:
+        message = _loads(line) if line.strip() else {}
+    except ValueError:
+        message = {}
+    if not isinstance(message, dict):
+        message = {}
+
+    try:
+        if "jsonrpc" in message:
+            await serve_mcp(reader, writer, line)
+        else:
+            transport = await _write_handshake(writer, message.get("transport"))
+            await serve_legacy(reader, writer, transport)
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def run_socket(path: str) -> None:
+    """
+    Serve MCP and legacy JSON-RPC clients on a UNIX domain socket.
+
+    Each connection is independent, so several clients (or a client's
+    connection pool) can keep requests in flight at the same time. The
+    protocol is chosen per connection from the client's first line.
+
+    Args:
+        path: Filesystem path of the socket
+    """
+    await prepare_legacy_listings()
+
+    # Remove a socket left behind by a previous run
+    if os.path.exists(path):
+        os.unlink(path)
+
+    server = await asyncio.start_unix_server(_handle_socket_client, path=path, limit=2 ** 24)
+    logger.info(f"Zotero MCP server listening on {path}")
+
+    # Stop cleanly on SIGTERM so the socket file is removed
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+
+    try:
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        logger.info("Stopping Zotero MCP server")
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
 
 
 def main():
     """Main entry point for the server."""
+    parser = argparse.ArgumentParser(description="Zotero MCP Server")
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Serve the legacy JSON-RPC dialect using newline-delimited JSON"
+    )
+    parser.add_argument(
+        "--msgpack",
+        action="store_true",
+        help="Serve the legacy JSON-RPC dialect using length-prefixed MessagePack framing"
+    )
+    parser.add_argument(
+        "--framed",
+        action="store_true",
+        help="Serve the legacy JSON-RPC dialect using length-prefixed JSON framing"
+    )
+    parser.add_argument(
+        "--socket",
+        nargs="?",
+        const=DEFAULT_SOCKET_PATH,
+        metavar="PATH",
+        help=f"Serve MCP and legacy JSON-RPC clients on a UNIX domain socket (default: {DEFAULT_SOCKET_PATH})"
+    )
+    args = parser.parse_args()
+
     logger.info("Starting Zotero MCP Server")
 
     # Initialize Zotero client
     init_zotero_client()
 
-    # Run the MCP server (stdio transport by default)
-    mcp.run()
+    # libuv's event loop has less overhead per await and per socket or pipe
+    # operation; it also serves the loop FastMCP starts through anyio
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    if args.socket:
+        asyncio.run(run_socket(args.socket))
+    elif args.msgpack:
+        asyncio.run(run_legacy_stdio("msgpack"))
+    elif args.framed:
+        asyncio.run(run_legacy_stdio("framed"))
+    elif args.legacy:
+        asyncio.run(run_legacy_stdio("json"))
+    else:
+        # Run the MCP server (stdio transport by default)
+        mcp.run()
 
 
 if __name__ == "__main__":
@@ -3,25 +3,171 @@
 Simple test client for the Zotero MCP server.
 
 This script tests the basic functionality of the Zotero MCP server
-by sending JSON-RPC requests directly to stdin/stdout.
+by starting it and sending JSON-RPC requests directly to its stdin/stdout.
+Run with --manual to relay the requests to a server by hand instead.
+
+Each test is also a subcommand, e.g. `test_client.py search --query ethics`;
+without one an interactive menu is shown.
 """
 
+import io
 import json
 import os
 import sys
-from dotenv import load_dotenv
+import time
+import argparse
+import subprocess
+from itertools import islice
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson encodes to and parses from bytes directly; the stdlib fallback
+# produces the same bytes. json is still used for indented output.
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    def dumps(message):
+        return json.dumps(message).encode()
+    loads = json.loads
+
+# Command that starts the server under test
+SERVER_COMMAND = (sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'server.py'), '--legacy')
+
+# Server process the requests are sent to; None when they are relayed by hand
+server_process = None
 
-# Load environment variables
-load_dotenv()
+# Seconds a response to a read-only request is reused; 0 disables the cache
+RESPONSE_CACHE_TTL = 60
+
+# (method, params JSON) -> (time received, response) for read-only requests
+response_cache = {}
+
+# Defaults for the search and add_item tests
+DEFAULT_QUERY = "medical ethics"
+DEFAULT_TITLE = "Ethical Considerations in Military Medical Triage"
+DEFAULT_JOURNAL = "Journal of Military Ethics"
+DEFAULT_YEAR = "2023"
+
+# Fixed part of the item added by test_add_item; the title, journal and year
+# are filled in for each run
+ADD_ITEM_BASE = {
+    "item_type": "journalArticle",
+    "creators": [
+        {
+            "creatorType": "author",
+            "firstName": "John",
+            "lastName": "Smith"
+        },
+        {
+            "creatorType": "author",
+            "firstName": "Jane",
+            "lastName": "Doe"
+        }
+    ],
+    "additional_fields": {
+        "volume": "15",
+        "issue": "2",
+        "pages": "123-145",
+        "abstractNote": "This article discusses ethical considerations in military medical triage scenarios."
+    }
+}
+
+def make_request(method, params, request_id):
+    """
+    Build a JSON-RPC request.
+    
+    Args:
+        method: Name of the method to call
+        params: Parameters for the method
+        request_id: Id the response will carry
+        
+    Returns:
+        The JSON-RPC request object
+    """
+    return {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
 
 def main():
     """Main function to test the Zotero MCP server."""
-    print("Zotero MCP Server Test Client")
-    print("============================")
-    print("This client will test the basic functionality of the Zotero MCP server.")
-    print("Make sure the server is running in another terminal.")
-    print()
+    global server_process, RESPONSE_CACHE_TTL
+    from dotenv import load_dotenv
+    
+    parser = argparse.ArgumentParser(description="Zotero MCP Server Test Client")
+    parser.add_argument(
+        "--manual",
+        action="store_true",
+        help="Print each request and read the response back instead of starting the server"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Send every request to the server instead of reusing recent responses"
+    )
+    
+    # One subcommand per test, so a test can be run straight from a script;
+    # without one the interactive menu is shown
+    subcommands = parser.add_subparsers(dest="command", metavar="command")
+    subcommands.add_parser("repl", help="Choose tests from an interactive menu (default)")
+    subcommands.add_parser("list-resources", help="List resources")
+    subcommands.add_parser("list-tools", help="List tools")
+    search = subcommands.add_parser("search", help="Search items")
+    search.add_argument("--query", default=DEFAULT_QUERY, help="Search query")
+    subcommands.add_parser("recent", help="Get recent items")
+    add = subcommands.add_parser("add", help="Add a new item")
+    add.add_argument("--title", default=DEFAULT_TITLE, help="Item title")
+    add.add_argument("--journal", default=DEFAULT_JOURNAL, help="Journal name")
+    add.add_argument("--year", default=DEFAULT_YEAR, help="Publication year")
+    
+    args = parser.parse_args()
+    if args.no_cache:
+        RESPONSE_CACHE_TTL = 0
     
+    commands = {
+        "list-resources": test_list_resources,
+        "list-tools": test_list_tools,
+        "search": lambda: test_search_items(args.query),
+        "recent": test_get_recent_items,
+        "add": lambda: test_add_item(args.title, args.journal, args.year),
+    }
+    command = commands.get(args.command)
+    
+    # Load environment variables
+    load_dotenv()
+    
+    if command is None:
+        print("Zotero MCP Server Test Client")
+        print("============================")
+        print("This client will test the basic functionality of the Zotero MCP server.")
+    if args.manual:
+        print("Make sure the server is running in another terminal.")
+    else:
+        print("Starting Zotero MCP server...")
+        server_process = start_server()
+        if not server_process:
+            print("Failed to start server. Exiting.")
+            return
+    
+    try:
+        if command is None:
+            print()
+            run_menu()
+        else:
+            command()
+    finally:
+        if server_process:
+            server_process.terminate()
+            server_process.wait(timeout=5)
+
+def run_menu():
+    """Let the user pick tests to run until they choose to exit."""
     while True:
         print("\nChoose a test to run:")
         print("1. List resources")
@@ -38,12 +184,15 @@ def main():
         elif choice == "2":
             test_list_tools()
         elif choice == "3":
-            query = input("Enter search query (default: 'medical ethics'): ") or "medical ethics"
+            query = input(f"Enter search query (default: '{DEFAULT_QUERY}'): ") or DEFAULT_QUERY
             test_search_items(query)
         elif choice == "4":
             test_get_recent_items()
         elif choice == "5":
-            test_add_item()
+            title = input(f"Enter item title (default: '{DEFAULT_TITLE}'): ") or DEFAULT_TITLE
+            journal = input(f"Enter journal name (default: '{DEFAULT_JOURNAL}'): ") or DEFAULT_JOURNAL
+            year = input(f"Enter publication year (default: '{DEFAULT_YEAR}'): ") or DEFAULT_YEAR
+            test_add_item(title, journal, year)
         elif choice == "6":
             print("Exiting...")
             break
@@ -55,12 +204,7 @@ def test_list_resources():
     print("\nTesting list_resources...")
     
     # Create a request to list resources
-    request = {
-        "jsonrpc": "2.0",
-        "method": "list_resources",
-        "params": {},
-        "id": 1
-    }
+    request = make_request("list_resources", {}, 1)
     
     # Send the request and get the response
     response = send_request_to_server(request)
@@ -80,12 +224,7 @@ def test_list_tools():
     print("\nTesting list_tools...")
     
     # Create a request to list tools
-    request = {
-        "jsonrpc": "2.0",
-        "method": "list_tools",
-        "params": {},
-        "id": 1
-    }
+    request = make_request("list_tools", {}, 1)
     
     # Send the request and get the response
     response = send_request_to_server(request)
@@ -105,18 +244,13 @@ def test_search_items(query):
     print(f"\nTesting search_items with query '{query}'...")
     
     # Create a request to search items
-    request = {
-        "jsonrpc": "2.0",
-        "method": "call_tool",
-        "params": {
-            "name": "search_items",
-            "arguments": {
-                "query": query,
-                "limit": 5
-            }
-        },
-        "id": 1
-    }
+    request = make_request("call_tool", {
+        "name": "search_items",
+        "arguments": {
+            "query": query,
+            "limit": 5
+        }
+    }, 1)
     
     # Send the request and get the response
     response = send_request_to_server(request)
@@ -125,7 +259,7 @@ def test_search_items(query):
     if response and "result" in response:
         print("Success!")
         content = response["result"]["content"][0]["text"]
-        results = json.loads(content)
+        results = loads(content)
         print(f"Found {len(results['results'])} results for query '{query}':")
         for i, item in enumerate(results["results"]):
             if "data" in item and "title" in item["data"]:
@@ -140,14 +274,9 @@ def test_get_recent_items():
     print("\nTesting get_recent_items...")
     
     # Create a request to get recent items
-    request = {
-        "jsonrpc": "2.0",
-        "method": "read_resource",
-        "params": {
-            "uri": "zotero://items/recent"
-        },
-        "id": 1
-    }
+    request = make_request("read_resource", {
+        "uri": "zotero://items/recent"
+    }, 1)
     
     # Send the request and get the response
     response = send_request_to_server(request)
@@ -156,9 +285,9 @@ def test_get_recent_items():
     if response and "result" in response:
         print("Success!")
         content = response["result"]["contents"][0]["text"]
-        items = json.loads(content)
-        print(f"Found {len(items)} recent items:")
-        for i, item in enumerate(items[:5]):  # Show only the first 5 items
+        items = first_items(content, 5)  # Show only the first 5 items
+        print(f"Showing {len(items)} recent items:")
+        for i, item in enumerate(items):
             if "data" in item and "title" in item["data"]:
                 print(f"  {i+1}. {item['data']['title']}")
             else:
@@ -166,48 +295,36 @@ def test_get_recent_items():
     else:
         print("Failed to get recent items.")
 
-def test_add_item():
+def first_items(content, count):
+    """
+    Parse only the first items of a JSON array.
+    
+    With ijson installed the array is parsed incrementally and parsing stops
+    once enough items are found; otherwise the whole array is loaded.
+    
+    Args:
+        content: JSON text of an array
+        count: Number of items wanted
+        
+    Returns:
+        List of at most count items
+    """
+    if ijson is None:
+        return loads(content)[:count]
+    return list(islice(ijson.items(io.BytesIO(content.encode()), "item", use_float=True), count))
+
+def test_add_item(title, journal, year):
     """Test the add_item tool."""
     print("\nTesting add_item...")
     
-    # Get item details from user
-    title = input("Enter item title (default: 'Ethical Considerations in Military Medical Triage'): ") or "Ethical Considerations in Military Medical Triage"
-    journal = input("Enter journal name (default: 'Journal of Military Ethics'): ") or "Journal of Military Ethics"
-    year = input("Enter publication year (default: '2023'): ") or "2023"
-    
     # Create a request to add an item
-    request = {
-        "jsonrpc": "2.0",
-        "method": "call_tool",
-        "params": {
-            "name": "add_item",
-            "arguments": {
-                "item_type": "journalArticle",
-                "title": title,
-                "creators": [
-                    {
-                        "creatorType": "author",
-                        "firstName": "John",
-                        "lastName": "Smith"
-                    },
-                    {
-                        "creatorType": "author",
-                        "firstName": "Jane",
-                        "lastName": "Doe"
-                    }
-                ],
-                "additional_fields": {
-                    "publicationTitle": journal,
-                    "volume": "15",
-                    "issue": "2",
-                    "pages": "123-145",
-                    "date": year,
-                    "abstractNote": "This article discusses ethical considerations in military medical triage scenarios."
-                }
-            }
-        },
-        "id": 1
+    arguments = {**ADD_ITEM_BASE, "title": title}
+    arguments["additional_fields"] = {
+        **ADD_ITEM_BASE["additional_fields"],
+        "publicationTitle": journal,
+        "date": year
     }
+    request = make_request("call_tool", {"name": "add_item", "arguments": arguments}, 1)
     
     # Send the request and get the response
     response = send_request_to_server(request)
@@ -216,7 +333,7 @@ def test_add_item():
     if response and "result" in response:
         print("Success!")
         content = response["result"]["content"][0]["text"]
-        result = json.loads(content)
+        result = loads(content)
         if result.get("success"):
             print("Item added successfully!")
             item_key = result["successful"]["0"]["key"]
@@ -227,11 +344,89 @@ def test_add_item():
     else:
         print("Failed to add item.")
 
+def start_server():
+    """
+    Start the Zotero MCP server as a child process speaking JSON-RPC on stdio.
+    
+    Returns:
+        The server process, or None if the server failed to start
+    """
+    try:
+        process = subprocess.Popen(
+            SERVER_COMMAND,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+        
+        # The server announces its transport on stdout once it is ready
+        line = process.stdout.readline()
+        if line and loads(line).get("transport") == "json":
+            return process
+        
+        print("Server didn't start properly.")
+        process.terminate()
+        return None
+    
+    except Exception as e:
+        print(f"Error starting server: {str(e)}")
+        return None
+
 def send_request_to_server(request):
     """
     Send a request to the server and get the response.
     
-    This function assumes the server is running in another terminal.
+    Responses to listings and searches are reused for RESPONSE_CACHE_TTL
+    seconds. Any other tool call may change the library, so it clears them.
+    
+    Args:
+        request: The request object to send
+        
+    Returns:
+        The response object from the server
+    """
+    params = request.get("params") or {}
+    if request["method"] in ("list_resources", "list_tools") or params.get("name") == "search_items":
+        key = (request["method"], json.dumps(params, sort_keys=True))
+    else:
+        key = None
+        if request["method"] == "call_tool":
+            response_cache.clear()
+    
+    if key is not None:
+        cached = response_cache.get(key)
+        if cached and time.monotonic() - cached[0] < RESPONSE_CACHE_TTL:
+            return cached[1]
+    
+    response = exchange_request(request)
+    if key is not None and RESPONSE_CACHE_TTL and response and "result" in response:
+        response_cache[key] = (time.monotonic(), response)
+    return response
+
+def exchange_request(request):
+    """
+    Send a request to the server process, or have the user relay it.
+    
+    Args:
+        request: The request object to send
+        
+    Returns:
+        The response object from the server
+    """
+    if server_process is None:
+        return relay_request_manually(request)
+    
+    try:
+        server_process.stdin.write(dumps(request) + b'\n')
+        server_process.stdin.flush()
+        return loads(server_process.stdout.readline())
+    except (OSError, ValueError) as e:
+        print(f"Error communicating with server: {str(e)}")
+        return None
+
+def relay_request_manually(request):
+    """
+    Have the user relay a request to a server running in another terminal.
+    
     It will prompt the user to copy the request, paste it into the server terminal,
     and then paste the response back.
     
@@ -242,7 +437,7 @@ def send_request_to_server(request):
         The response object from the server
     """
     # Convert request to JSON
-    request_json = json.dumps(request)
+    request_json = dumps(request).decode()
     
     # Print instructions for the user
     print("\nPlease copy the following request and paste it into the server terminal:")
@@ -259,7 +454,7 @@ def send_request_to_server(request):
     
     # Parse the response
     try:
-        response = json.loads(response_json)
+        response = loads(response_json)
         return response
     except json.JSONDecodeError:
         print("Error: Invalid JSON response")
@@ -3,12 +3,76 @@
 Simple test script for the Zotero MCP server.
 
 This script tests the basic functionality of the Zotero MCP server
-by sending JSON-RPC requests directly to the server.
+by sending JSON-RPC requests directly to the server, batching the
+requests that do not depend on each other.
 """
 
 import json
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson encodes to and parses from bytes directly; the stdlib fallback
+# produces the same bytes. json is still used for indented output.
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    def dumps(message):
+        return json.dumps(message).encode()
+    loads = json.loads
+
+SERVER_URL = "http://localhost:8080"
+
+# One client for every request, so the connection to the server stays open
+# between calls instead of being set up again for each one
+HTTP_CLIENT = httpx.Client(timeout=30)
+
+# Item added by test_add_item; the same on every run, so it is built once
+ADD_ITEM_ARGUMENTS = {
+    "item_type": "journalArticle",
+    "title": "Ethical Considerations in Military Medical Triage",
+    "creators": [
+        {
+            "creatorType": "author",
+            "firstName": "John",
+            "lastName": "Smith"
+        },
+        {
+            "creatorType": "author",
+            "firstName": "Jane",
+            "lastName": "Doe"
+        }
+    ],
+    "additional_fields": {
+        "publicationTitle": "Journal of Military Ethics",
+        "volume": "15",
+        "issue": "2",
+        "pages": "123-145",
+        "date": "2023",
+        "abstractNote": "This article discusses ethical considerations in military medical triage scenarios."
+    }
+}
+
+def make_request(method, params, request_id):
+    """
+    Build a JSON-RPC request.
+    
+    Args:
+        method: Name of the method to call
+        params: Parameters for the method
+        request_id: Id the response will carry
+        
+    Returns:
+        The JSON-RPC request object
+    """
+    return {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
 
 def send_request(request):
     """
@@ -20,145 +84,123 @@ def send_request(request):
     Returns:
         The JSON-RPC response object
     """
-    # Convert request to JSON
-    request_json = json.dumps(request)
-    
-    # Use subprocess to send the request to the server
-    process = subprocess.Popen(
-        ['curl', '-s', '-X', 'POST', '-d', request_json, 'http://localhost:8080'],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-    
-    # Get the response
-    stdout, stderr = process.communicate()
-    
-    if stderr:
-        print(f"Error: {stderr}", file=sys.stderr)
+    try:
+        response = HTTP_CLIENT.post(
+            SERVER_URL,
+            content=dumps(request),
+            headers={"Content-Type": "application/json"}
+        )
+    except httpx.HTTPError as e:
+        print(f"Error: {e}", file=sys.stderr)
         return None
     
     # Parse the response
     try:
-        response = json.loads(stdout)
-        return response
+        return loads(response.content)
     except json.JSONDecodeError:
-        print(f"Error decoding response: {stdout}", file=sys.stderr)
+        print(f"Error decoding response: {response.text}", file=sys.stderr)
         return None
 
 def test_list_resources():
-    """Test the list_resources method."""
-    request = {
-        "jsonrpc": "2.0",
-        "method": "list_resources",
-        "params": {},
-        "id": 1
-    }
+    """Build the list_resources request and the check for its response."""
+    request = make_request("list_resources", {}, 1)
     
-    print("Testing list_resources...")
-    response = send_request(request)
+    def handle(response):
+        print("Testing list_resources...")
+        
+        if response and "result" in response:
+            print("Success!")
+            print(f"Resources: {json.dumps(response['result'], indent=2)}")
+        else:
+            print("Failed to list resources.")
     
-    if response and "result" in response:
-        print("Success!")
-        print(f"Resources: {json.dumps(response['result'], indent=2)}")
-    else:
-        print("Failed to list resources.")
+    return request, handle
 
 def test_search_items():
-    """Test the search_items tool."""
-    request = {
-        "jsonrpc": "2.0",
-        "method": "call_tool",
-        "params": {
-            "name": "search_items",
-            "arguments": {
-                "query": "medical ethics",
-                "limit": 5
-            }
-        },
-        "id": 2
-    }
+    """Build the search_items request and the check for its response."""
+    request = make_request("call_tool", {
+        "name": "search_items",
+        "arguments": {
+            "query": "medical ethics",
+            "limit": 5
+        }
+    }, 2)
     
-    print("\nTesting search_items...")
-    response = send_request(request)
+    def handle(response):
+        print("\nTesting search_items...")
+        
+        if response and "result" in response:
+            print("Success!")
+            print(f"Search results: {json.dumps(response['result'], indent=2)}")
+        else:
+            print("Failed to search items.")
     
-    if response and "result" in response:
-        print("Success!")
-        print(f"Search results: {json.dumps(response['result'], indent=2)}")
-    else:
-        print("Failed to search items.")
+    return request, handle
 
 def test_add_item():
-    """Test the add_item tool."""
-    request = {
-        "jsonrpc": "2.0",
-        "method": "call_tool",
-        "params": {
-            "name": "add_item",
-            "arguments": {
-                "item_type": "journalArticle",
-                "title": "Ethical Considerations in Military Medical Triage",
-                "creators": [
-                    {
-                        "creatorType": "author",
-                        "firstName": "John",
-                        "lastName": "Smith"
-                    },
-                    {
-                        "creatorType": "author",
-                        "firstName": "Jane",
-                        "lastName": "Doe"
-                    }
-                ],
-                "additional_fields": {
-                    "publicationTitle": "Journal of Military Ethics",
-                    "volume": "15",
-                    "issue": "2",
-                    "pages": "123-145",
-                    "date": "2023",
-                    "abstractNote": "This article discusses ethical considerations in military medical triage scenarios."
-                }
-            }
-        },
-        "id": 3
-    }
+    """Build the add_item request and the check for its response."""
+    request = make_request("call_tool", {"name": "add_item", "arguments": ADD_ITEM_ARGUMENTS}, 3)
     
-    print("\nTesting add_item...")
-    response = send_request(request)
+    def handle(response):
+        print("\nTesting add_item...")
+        
+        if response and "result" in response:
+            print("Success!")
+            print(f"Add item result: {json.dumps(response['result'], indent=2)}")
+        else:
+            print("Failed to add item.")
     
-    if response and "result" in response:
-        print("Success!")
-        print(f"Add item result: {json.dumps(response['result'], indent=2)}")
-    else:
-        print("Failed to add item.")
+    return request, handle
 
 def test_get_recent_items():
-    """Test the get_recent_items resource."""
-    request = {
-        "jsonrpc": "2.0",
-        "method": "read_resource",
-        "params": {
-            "uri": "zotero://items/recent"
-        },
-        "id": 4
-    }
+    """Build the get_recent_items request and the check for its response."""
+    request = make_request("read_resource", {
+        "uri": "zotero://items/recent"
+    }, 4)
     
-    print("\nTesting get_recent_items...")
-    response = send_request(request)
+    def handle(response):
+        print("\nTesting get_recent_items...")
+        
+        if response and "result" in response:
+            print("Success!")
+            print(f"Recent items: {json.dumps(response['result'], indent=2)}")
+        else:
+            print("Failed to get recent items.")
+    
+    return request, handle
+
+def run_tests(tests):
+    """
+    Send the requests of several tests as one JSON-RPC batch.
+    
+    The server answers a batch with an array of responses in any order, so
+    each response is matched to its test by id. A server that does not take
+    batches gets the requests one by one instead, sent concurrently.
     
-    if response and "result" in response:
-        print("Success!")
-        print(f"Recent items: {json.dumps(response['result'], indent=2)}")
+    Args:
+        tests: Functions returning a request and a handler for its response
+    """
+    requests, handlers = zip(*(test() for test in tests))
+    responses = send_request(list(requests))
+    
+    if isinstance(responses, list):
+        by_id = {response.get("id"): response for response in responses}
+        responses = [by_id.get(request["id"]) for request in requests]
     else:
-        print("Failed to get recent items.")
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            responses = list(executor.map(send_request, requests))
+    
+    for handle, response in zip(handlers, responses):
+        handle(response)
 
 if __name__ == "__main__":
     print("Testing Zotero MCP Server...")
-    print("Note: This script assumes the server is running on http://localhost:8080")
+    print(f"Note: This script assumes the server is running on {SERVER_URL}")
     print("If the server is running on a different port or using stdio, this script won't work.")
     print("In that case, you can modify the script to use the appropriate transport.")
     
-    test_list_resources()
-    test_search_items()
-    test_add_item()
-    test_get_recent_items()
+    # The reads are independent and go in one batch. get_recent_items must
+    # see the added item, so it is only sent once add_item has completed.
+    run_tests([test_list_resources, test_search_items])
+    run_tests([test_add_item])
+    run_tests([test_get_recent_items])
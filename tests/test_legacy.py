@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Tests for the legacy JSON-RPC bridge the bundled example clients speak.
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import json
+import struct
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import server  # noqa: E402
+
+
+class FakeWriter:
+    """Collects what serve_legacy writes."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writelines(self, frames):
+        for frame in frames:
+            self.data += frame
+
+    async def drain(self):
+        pass
+
+
+def serve(payload, transport='json'):
+    """Feed payload to serve_legacy and return everything it wrote."""
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(payload)
+        reader.feed_eof()
+        writer = FakeWriter()
+        await asyncio.wait_for(server.serve_legacy(reader, writer, transport), 10)
+        return bytes(writer.data)
+    return asyncio.run(run())
+
+
+def frame(payload):
+    """Put a 4-byte big-endian length prefix in front of payload."""
+    return struct.pack('>I', len(payload)) + payload
+
+
+def unframe(data):
+    """Split length-prefixed frames apart."""
+    frames = []
+    while data:
+        (length,) = struct.unpack('>I', data[:4])
+        frames.append(data[4:4 + length])
+        data = data[4 + length:]
+    return frames
+
+
+def serve_lines(*messages):
+    """Send newline-delimited JSON messages and return the decoded responses."""
+    payload = b''.join(json.dumps(message).encode() + b'\n' for message in messages)
+    return [json.loads(line) for line in serve(payload).splitlines()]
+
+
+class InvalidRequestTest(unittest.TestCase):
+    """Messages that are not requests get an error instead of no answer."""
+
+    def assertInvalid(self, response):
+        self.assertEqual(response['error']['code'], -32600)
+        self.assertIsNone(response['id'])
+
+    def test_non_object_messages(self):
+        responses = serve_lines(5, 'x', None, {'id': 1}, {'method': ['list_tools'], 'id': 2})
+        self.assertEqual(len(responses), 5)
+        for response in responses:
+            self.assertInvalid(response)
+
+    def test_empty_batch(self):
+        (response,) = serve_lines([])
+        self.assertInvalid(response)
+
+    def test_batch_with_non_objects(self):
+        (responses,) = serve_lines([1, {'jsonrpc': '2.0', 'method': 'nope', 'id': 7}])
+        self.assertInvalid(responses[0])
+        self.assertEqual(responses[1]['error']['code'], -32601)
+        self.assertEqual(responses[1]['id'], 7)
+
+
+class ListingTest(unittest.TestCase):
+    """Listings are encoded before the first request is read."""
+
+    def test_listings_ready_before_requests(self):
+        server._legacy_listings.clear()
+        serve(b'')
+        self.assertEqual(set(server._legacy_listings), {'resources', 'resourceTemplates', 'tools'})
+
+
+class FakeLibrary:
+    """Stands in for the Zotero client behind the resources and tools."""
+
+    items_list = [
+        {'key': 'A', 'version': 1, 'meta': {}, 'data': {'title': 'Triage ethics', 'creators': [], 'date': '2023'}},
+        {'key': 'B', 'version': 1, 'meta': {}, 'data': {'title': 'Battlefield medicine', 'creators': []}},
+    ]
+
+    def __init__(self):
+        self.request = None
+
+    def last_modified_version(self):
+        return 1
+
+    def collections(self):
+        return [{'key': 'C1', 'data': {'name': 'Ethics'}}]
+
+    def items(self, limit, start, **params):
+        self.request = SimpleNamespace(headers={'Total-Results': str(len(self.items_list))})
+        return self.items_list[start:start + limit]
+
+
+def request(method, params, request_id):
+    return {'jsonrpc': '2.0', 'method': method, 'params': params, 'id': request_id}
+
+
+COLLECTIONS = request('read_resource', {'uri': 'zotero://collections'}, 1)
+SEARCH = request('call_tool', {
+    'name': 'search_items',
+    'arguments': {'query': 'triage', 'fields': ['key', 'data.title']},
+}, 2)
+
+
+class LibraryTestCase(unittest.TestCase):
+    """Runs the server against a FakeLibrary with empty caches."""
+
+    def setUp(self):
+        self.saved = (server.zot, server._library_version, server._search_index)
+        self.addCleanup(self.restore)
+        server.zot = FakeLibrary()
+        server._library_version = None
+        server._search_index = None
+        server._library_cache.clear()
+
+    def restore(self):
+        server.zot, server._library_version, server._search_index = self.saved
+        server._library_cache.clear()
+
+    def check_responses(self, responses):
+        by_id = {response['id']: response for response in responses}
+        collections = json.loads(by_id[1]['result']['contents'][0]['text'])
+        self.assertEqual(collections, FakeLibrary().collections())
+        search = json.loads(by_id[2]['result']['content'][0]['text'])
+        self.assertEqual(search['results'], [{'key': 'A', 'data': {'title': 'Triage ethics'}}])
+
+
+class TransportTest(LibraryTestCase):
+    """Every wire format carries single requests and batches."""
+
+    def test_json_batch(self):
+        (responses,) = serve_lines([COLLECTIONS, SEARCH])
+        self.assertEqual(len(responses), 2)
+        self.check_responses(responses)
+
+    def test_json_lines(self):
+        self.check_responses(serve_lines(COLLECTIONS, SEARCH))
+
+    def test_framed(self):
+        payload = frame(json.dumps(COLLECTIONS).encode()) + frame(json.dumps([SEARCH]).encode())
+        responses = []
+        # A single response and a batch of one, in whichever order they finished
+        for body in unframe(serve(payload, 'framed')):
+            message = json.loads(body)
+            responses.extend(message if isinstance(message, list) else [message])
+        self.check_responses(responses)
+
+    def test_framed_payload_with_newlines(self):
+        payload = frame(json.dumps(COLLECTIONS, indent=2).encode())
+        (body,) = unframe(serve(payload, 'framed'))
+        response = json.loads(body)
+        self.assertEqual(response['id'], 1)
+        self.assertIn('result', response)
+
+    @unittest.skipIf(server.msgpack is None, 'msgpack is not installed')
+    def test_msgpack(self):
+        msgpack = server.msgpack
+        # list_tools returns a pre-encoded listing, which MessagePack sends as its value
+        tools = request('list_tools', {}, 3)
+        payload = frame(msgpack.packb([COLLECTIONS, SEARCH, tools]))
+        (body,) = unframe(serve(payload, 'msgpack'))
+        responses = msgpack.unpackb(body, raw=False)
+        self.check_responses(responses[:2])
+        self.assertIn('search_items', [tool['name'] for tool in responses[2]['result']['tools']])
+
+
+@unittest.skipUnless(hasattr(server.orjson, 'Fragment'), 'needs orjson 3.10+ for orjson.Fragment')
+class EncodedTest(unittest.TestCase):
+    """Pre-encoded values are spliced into frames unchanged."""
+
+    def test_fragment_splicing(self):
+        listing = server._pre_encoded({'tools': [{'name': 'search_items'}]})
+        self.assertIsInstance(listing, server._Encoded)
+        message = server._dumps({'jsonrpc': '2.0', 'result': listing, 'id': 4})
+        self.assertEqual(json.loads(message), {'jsonrpc': '2.0', 'result': {'tools': [{'name': 'search_items'}]}, 'id': 4})
+
+    def test_large_text_encoded_once(self):
+        text = 'x' * server.LEGACY_ENCODED_TEXT_MIN
+        first = server._encoded_text(text)
+        self.assertIsInstance(first, server._Encoded)
+        self.assertIs(server._encoded_text(text), first)
+        self.assertEqual(json.loads(server._dumps({'text': first})), {'text': text})
+
+    def test_small_text_left_alone(self):
+        self.assertEqual(server._encoded_text('short'), 'short')
+
+
+class ProjectFieldsTest(unittest.TestCase):
+    """Only the requested dotted paths are kept."""
+
+    def test_projection(self):
+        item = {'key': 'A', 'version': 3, 'data': {'title': 'T', 'date': '2023', 'creators': []}}
+        self.assertEqual(
+            server.project_fields(item, ['key', 'data.title', 'data.missing', 'meta.numChildren']),
+            {'key': 'A', 'data': {'title': 'T'}},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
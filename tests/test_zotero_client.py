@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Tests for the Zotero client the server sets up.
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import json
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from pyzotero import zotero, zotero_errors
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import server  # noqa: E402
+
+
+class NotFoundHandler(BaseHTTPRequestHandler):
+    """Answers every request with 404, like the Zotero API for an unknown item."""
+
+    def do_GET(self):
+        body = b'Not found'
+        self.send_response(404)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SizeConnectionPoolTest(unittest.TestCase):
+    """The pooled HTTP client must behave like the one pyzotero built."""
+
+    def setUp(self):
+        self.zot = zotero.Zotero('1', 'user', 'secret')
+        self.original = self.zot.client
+        server._size_connection_pool(self.zot)
+        self.addCleanup(self.zot.client.close)
+
+    def test_keeps_client_settings(self):
+        client = self.zot.client
+        self.assertIsNot(client, self.original)
+        self.assertIs(type(client), type(self.original))
+        self.assertEqual(client.timeout, self.original.timeout)
+        self.assertEqual(client.trust_env, self.original.trust_env)
+        self.assertEqual(client.follow_redirects, self.original.follow_redirects)
+        self.assertEqual(dict(client.headers), dict(self.original.headers))
+
+    def test_http_error_becomes_pyzotero_error(self):
+        httpd = HTTPServer(('127.0.0.1', 0), NotFoundHandler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+
+        self.zot.endpoint = f'http://127.0.0.1:{httpd.server_port}'
+        with self.assertRaises(zotero_errors.PyZoteroError):
+            self.zot.item('ABCD2345')
+
+
+class LibraryCacheTest(unittest.TestCase):
+    """Library responses are evicted least recently used first."""
+
+    def setUp(self):
+        self.saved = (server.LIBRARY_CACHE_SIZE, server._library_version)
+        server.LIBRARY_CACHE_SIZE = 2
+        server._library_version = (1, float('inf'))
+        server._library_cache.clear()
+        self.addCleanup(self.restore)
+
+    def restore(self):
+        server.LIBRARY_CACHE_SIZE, server._library_version = self.saved
+        server._library_cache.clear()
+
+    def test_evicts_least_recently_used(self):
+        server.cached_by_version('a', lambda: 'A')
+        server.cached_by_version('b', lambda: 'B')
+        server.cached_by_version('a', lambda: self.fail('a was refetched'))
+        server.cached_by_version('c', lambda: 'C')
+        self.assertEqual(list(server._library_cache), ['a', 'c'])
+
+
+class SchemaCacheTest(unittest.TestCase):
+    """Concurrent schema lookups must leave one valid cache file behind."""
+
+    def setUp(self):
+        self.saved = (server.SCHEMA_CACHE_PATH, server._schema_cache)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        server.SCHEMA_CACHE_PATH = os.path.join(self.tmpdir.name, 'schema.json')
+        server._schema_cache = None
+        self.addCleanup(self.restore)
+
+    def restore(self):
+        server.SCHEMA_CACHE_PATH, server._schema_cache = self.saved
+
+    def test_concurrent_writes(self):
+        barrier = threading.Barrier(32)
+        errors = []
+
+        def lookup(i):
+            def fetch():
+                barrier.wait()
+                return {'fields': ['x' * 100] * 1000}
+            try:
+                server.cached_schema(f'key{i}', fetch)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=lookup, args=(i,)) for i in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(os.listdir(self.tmpdir.name), ['schema.json'])
+        with open(server.SCHEMA_CACHE_PATH, encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)), 32)
+
+
+class FakeLibrary:
+    """Stands in for the Zotero client, recording the item listings asked for."""
+
+    def __init__(self, items):
+        self.items_by_version = {1: items}
+        self.deleted_keys = {}
+        self.calls = []
+        self.request = None
+
+    def items(self, limit, start, **params):
+        self.calls.append(params)
+        since = params.get('since', 0)
+        items = [
+            item for version, listed in sorted(self.items_by_version.items(), reverse=True)
+            if version > since for item in listed
+        ]
+        self.request = SimpleNamespace(headers={'Total-Results': str(len(items))})
+        return items[start:start + limit]
+
+    def deleted(self, since):
+        return {'items': [key for version, keys in self.deleted_keys.items() if version > since for key in keys]}
+
+
+def make_item(key, title, deleted=False):
+    data = {'title': title, 'creators': []}
+    if deleted:
+        data['deleted'] = 1
+    return {'key': key, 'data': data, 'meta': {}}
+
+
+class SearchIndexTest(unittest.TestCase):
+    """The search index is updated from the changes since its version."""
+
+    def setUp(self):
+        self.saved = (server.zot, server._library_version, server._search_index)
+        self.addCleanup(self.restore)
+        self.library = FakeLibrary([make_item('A', 'Alpha'), make_item('B', 'Beta'), make_item('C', 'Gamma')])
+        server.zot = self.library
+        server._search_index = None
+        self.set_version(1)
+
+    def restore(self):
+        server.zot, server._library_version, server._search_index = self.saved
+
+    def set_version(self, version):
+        server._library_version = (version, float('inf'))
+
+    def keys(self):
+        return [item['key'] for _, item in server.search_index()]
+
+    def test_applies_changes_since_indexed_version(self):
+        self.assertEqual(self.keys(), ['A', 'B', 'C'])
+
+        self.library.items_by_version[2] = [make_item('B', 'Beta revised'), make_item('C', 'Gamma', deleted=True)]
+        self.library.items_by_version[3] = [make_item('D', 'Delta')]
+        self.library.deleted_keys[3] = ['A']
+        self.set_version(3)
+
+        self.assertEqual(self.keys(), ['D', 'B'])
+        self.assertEqual(self.library.calls[-1], {'since': 1, 'includeTrashed': 1})
+        self.assertIn('beta revised', server.search_index()[1][0])
+
+    def test_concurrent_updates_fetch_once(self):
+        server.search_index()
+        self.library.items_by_version[2] = [make_item('E', 'Epsilon')]
+        self.set_version(2)
+
+        threads = [threading.Thread(target=server.search_index) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.library.calls), 2)
+        self.assertEqual(self.keys(), ['E', 'A', 'B', 'C'])
+
+
+class FakeWriter:
+    """Stands in for the Zotero client when creating items."""
+
+    def __init__(self):
+        self.added = []
+
+    def item_template(self, item_type):
+        return {'itemType': item_type, 'title': '', 'creators': [], 'collections': []}
+
+    def create_items(self, templates):
+        successful = {
+            str(i): {'key': f'NEW{i}', 'version': 5, 'data': dict(template, key=f'NEW{i}', version=5)}
+            for i, template in enumerate(templates)
+        }
+        return {
+            'success': {index: item['key'] for index, item in successful.items()},
+            'successful': successful,
+            'unchanged': {},
+            'failed': {},
+        }
+
+    def addto_collection(self, collection, payload):
+        # As pyzotero does: the payload must be the item dict
+        self.added.append((collection, payload['key'], payload['data']['collections'] + [collection]))
+
+
+class AddToCollectionTest(unittest.TestCase):
+    """Created items are added to their collections and the library version reset."""
+
+    def setUp(self):
+        self.saved = (server.zot, server._library_version)
+        self.addCleanup(self.restore)
+        self.writer = FakeWriter()
+        server.zot = self.writer
+        server._library_version = (1, float('inf'))
+
+    def restore(self):
+        server.zot, server._library_version = self.saved
+
+    def test_add_item(self):
+        server.add_item.__wrapped__('book', 'A book', collection_key='COLL')
+        self.assertEqual(self.writer.added, [('COLL', 'NEW0', ['COLL'])])
+        self.assertIsNone(server._library_version)
+
+    def test_add_items(self):
+        server.add_items.__wrapped__([
+            {'item_type': 'book', 'title': 'First', 'collection_key': 'COLL'},
+            {'item_type': 'book', 'title': 'Second'},
+        ])
+        self.assertEqual(self.writer.added, [('COLL', 'NEW0', ['COLL'])])
+        self.assertIsNone(server._library_version)
+
+
+if __name__ == '__main__':
+    unittest.main()